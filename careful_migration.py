@@ -2,37 +2,53 @@
 """
 Script cuidadoso para migrar GenericBlockEditor para usar MentionWebView
 Preserva a estrutura do arquivo e faz apenas as mudanças necessárias
+
+As trocas passam pelo pipeline de codemods (scripts/codemod.py): casamento nos
+bytes do arquivo, snapshot antes de gravar e dry-run sem --apply. O passo 6 usa
+casamento tolerante porque o comentário original tinha um caractere de controle
+(resto de um "\u00E9" corrompido) onde o trecho abaixo tem espaço.
 """
 
-with open('lib/ui/organisms/editors/generic_block_editor.dart', 'r', encoding='utf-8') as f:
-    content = f.read()
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from codemod import Codemod
+
+TARGET = 'lib/ui/organisms/editors/generic_block_editor.dart'
+run = Codemod('careful_migration', apply='--apply' in sys.argv)
+
+
+def replace(old, new, tolerant=False):
+    if not run.replace(TARGET, old, new, tolerant=tolerant):
+        print(f'⚠️  Trecho não encontrado: {old.strip().splitlines()[0][:70]}')
 
 # 1. Atualizar imports - remover os antigos e adicionar o novo
-content = content.replace(
+replace(
     "import '../../molecules/inputs/mention_overlay.dart';\n",
     ""
 )
-content = content.replace(
+replace(
     "import '../../molecules/inputs/mention_protection_formatter.dart';\n",
     ""
 )
-content = content.replace(
+replace(
     "import '../../molecules/inputs/mention_text_controller.dart';\n",
     ""
 )
-content = content.replace(
+replace(
     "import '../../molecules/text/mention_text.dart';",
     "import '../../molecules/inputs/mention_webview.dart';\nimport '../../molecules/text/mention_text.dart';"
 )
 
 # 2. Substituir late TextEditingController _controller por String _currentText
-content = content.replace(
+replace(
     "class _GBBlockWidgetState extends State<_GBBlockWidget> {\n  late TextEditingController _controller;",
     "class _GBBlockWidgetState extends State<_GBBlockWidget> {\n  String _currentText = '';"
 )
 
 # 3. Substituir _controller = MentionTextEditingController por _currentText = widget.block.content
-content = content.replace(
+replace(
     "    _controller = MentionTextEditingController(text: widget.block.content);\n    _controller.addListener(_onContentChanged);",
     "    _currentText = widget.block.content;"
 )
@@ -58,15 +74,15 @@ old_emoji = """      widget.registerInsertHandler?.call(widget.index, (emoji) {
 
 new_emoji = "      // Note: Emoji insertion for WebView will be handled differently"
 
-content = content.replace(old_emoji, new_emoji)
+replace(old_emoji, new_emoji)
 
 # 5. Renomear _onContentChanged para _onTextChanged
-content = content.replace(
+replace(
     "  void _onContentChanged() {\n    debugPrint('🟢🟢🟢 [_GBBlockWidget._onContentChanged] text.length=${_controller.text.length}');",
     "  void _onTextChanged(String newText) {\n    debugPrint('🟢🟢🟢 [_GBBlockWidget._onTextChanged] text.length=${newText.length}');\n    _currentText = newText;"
 )
 
-content = content.replace(
+replace(
     "        widget.onChanged(widget.block.copyWith(content: _controller.text));",
     "        widget.onChanged(widget.block.copyWith(content: newText));"
 )
@@ -98,16 +114,16 @@ new_did_update = """  @override
     }
   }"""
 
-content = content.replace(old_did_update, new_did_update)
+replace(old_did_update, new_did_update, tolerant=True)
 
 # 7. Remover _controller.dispose()
-content = content.replace(
+replace(
     "    _debounceTimer?.cancel();\n    _textFocusNode?.dispose();\n    _controller.dispose();",
     "    _debounceTimer?.cancel();\n    _textFocusNode?.dispose();"
 )
 
 # 8. Atualizar _buildTextBlock - substituir _controller.text por _currentText
-content = content.replace(
+replace(
     "      final text = _controller.text.trim();",
     "      final text = _currentText.trim();"
 )
@@ -152,18 +168,15 @@ new_mention_field = """    return MentionWebView(
       onChanged: _onTextChanged,
     );"""
 
-content = content.replace(old_mention_field, new_mention_field)
+replace(old_mention_field, new_mention_field)
 
 # 10. Remover as classes _MentionTextField no final do arquivo
 # Encontrar o início da classe _MentionTextField
 start_marker = "\n/// TextField com suporte a menções (@mentions)\n"
+content = run.read(TARGET)
 if start_marker in content:
     idx = content.index(start_marker)
-    content = content[:idx] + "\n"
-
-# Salvar
-with open('lib/ui/organisms/editors/generic_block_editor.dart', 'w', encoding='utf-8') as f:
-    f.write(content)
+    run.write(TARGET, content[:idx] + "\n")
 
+run.commit()
 print("✅ Migração cuidadosa completa!")
-
@@ -3,6 +3,12 @@
 Script completo para migrar GenericBlockEditor para usar MentionWebView
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from snapshot_store import snapshot_files
+
 # Ler o arquivo
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -129,6 +135,8 @@ new_build_text = '''  Widget _buildTextBlock() {
 content = content.replace(old_build_text, new_build_text)
 
 # Salvar o arquivo
+snapshot_files('complete_migration', ['lib/ui/organisms/editors/generic_block_editor.dart'])
+
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'w', encoding='utf-8') as f:
     f.write(content)
 
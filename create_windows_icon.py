@@ -1,19 +1,32 @@
 #!/usr/bin/env python3
 """
 Script para criar o ícone do Windows usando o arquivo ICON SEM FUNDO
+
+Depois de gerar o .ico, roda o estágio de assets (scripts/optimize_assets.py):
+otimização sem perdas das entradas do ícone. Para otimizar também os PNGs de
+assets/images/ e o payload do instalador, use --assets.
+
+Uso:
+    python create_windows_icon.py
+    python create_windows_icon.py --source logo.png --assets
+    python create_windows_icon.py --no-optimize
 """
 
 from PIL import Image
+import argparse
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
 
-def create_windows_icon():
+ICO_PATH = 'windows/runner/resources/app_icon.ico'
+DEFAULT_SOURCE = 'C:/Users/PC/Downloads/logo my business ICON SEM FUNDO.png'
+
+def create_windows_icon(source_icon=DEFAULT_SOURCE):
     """
     Cria o ícone do Windows (.ico) a partir do arquivo ICON SEM FUNDO
     """
     
-    # Caminho do ícone sem fundo
-    source_icon = 'C:/Users/PC/Downloads/logo my business ICON SEM FUNDO.png'
-    
     print('🎨 Criando ícone do Windows...\n')
     
     try:
@@ -23,7 +36,7 @@ def create_windows_icon():
         print(f'   Modo: {img.mode}')
         
         # Criar ícone ICO para Windows com múltiplos tamanhos
-        create_ico_from_image(img, 'windows/runner/resources/app_icon.ico')
+        create_ico_from_image(img, ICO_PATH)
         
         print('\n✨ Ícone do Windows criado com sucesso!')
         print('📝 Arquivo: logo my business ICON SEM FUNDO.png')
@@ -43,19 +56,41 @@ def create_ico_from_image(img, ico_path):
     Mantém a transparência para ícones sem fundo
     """
     sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    icons = []
-
-    for size in sizes:
-        resized = img.resize(size, Image.Resampling.LANCZOS)
-        # Manter o modo RGBA para preservar transparência
-        icons.append(resized)
 
-    # Salvar como ICO mantendo transparência
-    icons[0].save(ico_path, format='ICO', sizes=sizes)
+    # Salvar como ICO mantendo transparência (modo RGBA). O Pillow redimensiona
+    # a partir da imagem salva e ignora tamanhos maiores que ela, então a
+    # origem precisa ser a imagem original, não a versão 16x16
+    img.save(ico_path, format='ICO', sizes=sizes)
     print(f'✅ Ícone ICO criado: {ico_path}')
     print(f'   Tamanhos incluídos: 16x16, 32x32, 48x48, 64x64, 128x128, 256x256')
     print(f'   ✨ Transparência preservada!')
 
+def optimize_assets(include_assets=False):
+    """
+    Estágio de assets: otimização sem perdas do ícone (e, com include_assets,
+    dos PNGs do app e do payload do instalador), com relatório de bytes
+    """
+    import optimize_assets as stage
+
+    if include_assets:
+        return stage.main(['--apply'])
+    results = stage.optimize_files([ICO_PATH])
+    stage.print_results(results)
+    run = stage.Codemod('create-windows-icon', apply=True)
+    for r in results:
+        if r['after'] < r['before']:
+            run.write(r['file'], r['data'])
+    run.commit()
+    return 0
+
 if __name__ == '__main__':
-    create_windows_icon()
+    parser = argparse.ArgumentParser(description='Cria o ícone do Windows e otimiza os assets')
+    parser.add_argument('--source', default=DEFAULT_SOURCE, help='PNG do ícone sem fundo')
+    parser.add_argument('--assets', action='store_true',
+                        help='otimiza também assets/images e o payload do instalador')
+    parser.add_argument('--no-optimize', action='store_true', help='não roda o estágio de assets')
+    args = parser.parse_args()
+
+    if create_windows_icon(args.source) and not args.no_optimize:
+        optimize_assets(args.assets)
 
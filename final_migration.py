@@ -3,6 +3,12 @@
 Script final para migrar GenericBlockEditor para usar MentionWebView
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from snapshot_store import snapshot_files
+
 # Ler o arquivo
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'r', encoding='utf-8') as f:
     lines = f.readlines()
@@ -141,6 +147,8 @@ for i, line in enumerate(lines):
         break
 
 # Salvar o arquivo
+snapshot_files('final_migration', ['lib/ui/organisms/editors/generic_block_editor.dart'])
+
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'w', encoding='utf-8') as f:
     f.writelines(lines)
 
@@ -1,4 +1,10 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from snapshot_store import snapshot_files
+
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'r', encoding='utf-8') as f:
     lines = f.readlines()
 
@@ -30,6 +36,8 @@ for i, line in enumerate(lines):
         break
 
 # Salvar
+snapshot_files('fix_did_update', ['lib/ui/organisms/editors/generic_block_editor.dart'])
+
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'w', encoding='utf-8') as f:
     f.writelines(lines)
 
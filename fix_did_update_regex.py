@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from snapshot_store import snapshot_files
 
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'r', encoding='utf-8') as f:
     content = f.read()
@@ -17,6 +22,8 @@ replacement = '''  @override
 
 content = re.sub(pattern, replacement, content, flags=re.DOTALL)
 
+snapshot_files('fix_did_update_regex', ['lib/ui/organisms/editors/generic_block_editor.dart'])
+
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'w', encoding='utf-8') as f:
     f.write(content)
 
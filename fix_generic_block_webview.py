@@ -3,7 +3,12 @@
 Script para migrar GenericBlockEditor para usar MentionWebView
 """
 
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from snapshot_store import snapshot_files
 
 # Ler o arquivo
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'r', encoding='utf-8') as f:
@@ -138,6 +143,8 @@ new_build_text = '''  Widget _buildTextBlock() {
 content = re.sub(old_build_text, new_build_text, content, flags=re.DOTALL)
 
 # Salvar o arquivo
+snapshot_files('fix_generic_block_webview', ['lib/ui/organisms/editors/generic_block_editor.dart'])
+
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'w', encoding='utf-8') as f:
     f.write(content)
 
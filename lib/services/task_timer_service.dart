@@ -86,6 +86,8 @@ class TaskTimerService extends ChangeNotifier {
       _startTime = DateTime.now();
       _elapsedSeconds = 0;
       _isRunning = true;
+      // Marcadores lidos por scripts/log_metrics.py (duração de cada sessão)
+      debugPrint('[TaskTimerService] start taskId=$taskId');
 
       // Salvar estado
       await _saveState();
@@ -140,6 +142,7 @@ class TaskTimerService extends ChangeNotifier {
         timeLogId: _activeTimeLogId!,
         description: description,
       );
+      debugPrint('[TaskTimerService] stop taskId=$_activeTaskId');
 
       // Limpar estado
       _activeTaskId = null;
@@ -203,6 +203,8 @@ class UploadManager {
         final fileId = record['fileId'] as String;
         final it = record['item'] as MemoryUploadItem;
 
+        // Marcadores lidos por scripts/log_metrics.py (duração de cada upload)
+        debugPrint('[UploadManager] start fileId=$fileId');
         try {
           // Upload usando método apropriado (task ou subtask)
           final UploadedDriveFile up;
@@ -244,8 +246,10 @@ class UploadManager {
             driveFileId: up.id,
             driveFileUrl: up.publicViewUrl ?? '',
           );
+          debugPrint('[UploadManager] done fileId=$fileId');
         } catch (e) {
           // Se falhar o upload de um arquivo, continua com os outros
+          debugPrint('[UploadManager] fail fileId=$fileId erro=$e');
         }
 
         done += 1;
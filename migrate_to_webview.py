@@ -3,6 +3,12 @@
 Script para migrar GenericBlockEditor para usar MentionWebView
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from snapshot_store import snapshot_files
+
 # Ler o arquivo
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'r', encoding='utf-8') as f:
     lines = f.readlines()
@@ -41,6 +47,8 @@ for i, line in enumerate(lines):
 lines = new_lines
 
 # Salvar o arquivo
+snapshot_files('migrate_to_webview', ['lib/ui/organisms/editors/generic_block_editor.dart'])
+
 with open('lib/ui/organisms/editors/generic_block_editor.dart', 'w', encoding='utf-8') as f:
     f.writelines(lines)
 
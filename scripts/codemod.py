@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Pipeline comum dos codemods (scripts que reescrevem arquivos do projeto)
+
+Os scripts de migração antigos (careful_migration.py, final_migration.py, ...)
+liam e sobrescreviam os arquivos diretamente. Os codemods novos planejam as
+mudanças num objeto Codemod e só escrevem no apply(), o que permite:
+    - dry-run por padrão, com resumo de linhas adicionadas/removidas por arquivo
+    - leitura e escrita sem perdas (bytes inválidos em UTF-8 são preservados)
+    - um único ponto para validações antes de tocar no disco
+    - snapshot dos arquivos tocados antes de gravar (snapshot_store.py), para
+      desfazer qualquer execução com `snapshot_store.py restore <id> --apply`
+    - substituições em bytes (replace/replace_in_tree): o arquivo é lido por
+      mmap, o trecho é procurado nos bytes crus e a troca é emendada sem
+      decodificar/recodificar o arquivo inteiro. Funciona em arquivos com NUL
+      e caracteres de controle (que o grep trata como binários) e em arquivos
+      que não são UTF-8 (a codificação é detectada uma vez por arquivo)
+
+Uso:
+    from codemod import Codemod
+
+    run = Codemod('remover-arquivos-mortos', apply=args.apply)
+    run.write('lib/x.dart', novo_conteudo)
+    run.delete('lib/y.dart')
+    run.replace('lib/z.dart', 'trecho antigo', 'trecho novo')
+    run.commit()
+"""
+
+import codecs
+import mmap
+import re
+from pathlib import Path
+
+from snapshot_store import SnapshotStore, format_size
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# surrogateescape devolve exatamente os mesmos bytes na escrita, mesmo em
+# arquivos com NUL ou sequências que não são UTF-8 válido
+ENCODING = 'utf-8'
+ERRORS = 'surrogateescape'
+
+
+def read_text(path):
+    """Lê um arquivo do projeto sem perder bytes fora do UTF-8"""
+    return Path(path).read_bytes().decode(ENCODING, ERRORS)
+
+
+def detect_newline(text):
+    """Quebra de linha predominante do arquivo (o projeto tem arquivos CRLF e LF)"""
+    crlf = text.count('\r\n')
+    return '\r\n' if crlf and crlf * 2 >= text.count('\n') else '\n'
+
+
+def with_newline(text, newline):
+    """Normaliza as quebras de linha de text para newline"""
+    text = text.replace('\r\n', '\n')
+    return text if newline == '\n' else text.replace('\n', newline)
+
+
+def detect_encoding(buf):
+    """
+    Codificação de um buffer (bytes, mmap ou memoryview): BOM UTF-8, UTF-8
+    válido, cp1252 ou latin-1. Todas são compatíveis com ASCII, então trechos
+    ASCII têm os mesmos bytes em qualquer uma delas. A validação é incremental
+    (blocos de 1 MB), sem montar o texto inteiro na memória
+    """
+    view = memoryview(buf)
+    if view[:3] == codecs.BOM_UTF8:
+        return 'utf-8-sig'
+    for encoding in ('utf-8', 'cp1252'):
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            for i in range(0, len(view), 1 << 20):
+                decoder.decode(view[i:i + (1 << 20)])
+            decoder.decode(b'', final=True)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'latin-1'
+
+
+# Sequências UTF-8 multibyte válidas e bytes não-ASCII em geral
+_UTF8_SEQ_RE = re.compile(rb'[\xc2-\xdf][\x80-\xbf]|[\xe0-\xef][\x80-\xbf]{2}|[\xf0-\xf4][\x80-\xbf]{3}')
+_HIGH_BYTE_RE = re.compile(rb'[\x80-\xff]')
+
+
+def dominant_encoding(buf, encoding):
+    """
+    Codificação para texto novo num arquivo já detectado: um arquivo cp1252 ou
+    latin-1 em que a maior parte dos bytes não-ASCII forma sequências UTF-8
+    válidas é UTF-8 com alguns bytes soltos, e o texto novo vai em UTF-8
+    """
+    if encoding in ('utf-8', 'utf-8-sig'):
+        return 'utf-8'
+    utf8 = sum(m.end() - m.start() for m in _UTF8_SEQ_RE.finditer(buf))
+    high = sum(1 for _ in _HIGH_BYTE_RE.finditer(buf))
+    return 'utf-8' if utf8 > high - utf8 else encoding
+
+
+def detect_newline_bytes(buf):
+    """Quebra de linha pela primeira linha do buffer (sem varrer o arquivo)"""
+    i = buf.find(b'\n')
+    return '\r\n' if i > 0 and buf[i - 1:i] == b'\r' else '\n'
+
+
+# Espaços e caracteres de controle: no modo tolerante qualquer sequência deles
+# casa com qualquer outra (ex.: "bloco  E9" casa com "bloco \x00E9", resto de
+# um "\u00E9" corrompido, e "\n" casa com "\r\n")
+_LOOSE_RE = re.compile(rb'[\s\x00-\x1f]+')
+_LOOSE_EDGE = rb'[\t \x00-\x08\x0b\x0c\x0e-\x1f]*'
+
+
+def _loose_pattern(needle):
+    body = needle.strip(b' \t')
+    pattern = _LOOSE_RE.pattern.join(re.escape(p) for p in _LOOSE_RE.split(body))
+    # indentação nas pontas só casa na mesma linha (não engole a quebra anterior)
+    if needle[:1] in (b' ', b'\t'):
+        pattern = _LOOSE_EDGE + pattern
+    if needle[-1:] in (b' ', b'\t'):
+        pattern += _LOOSE_EDGE
+    return re.compile(pattern)
+
+
+# Arquivos em que o resumo mostra bytes em vez de linhas
+BINARY_SUFFIXES = {'.png', '.ico', '.jpg', '.jpeg', '.gif', '.webp', '.bmp', '.ttf', '.otf'}
+
+
+def is_binary(rel):
+    """
+    Arquivo binário (imagem, ícone, fonte) pela extensão. O conteúdo não
+    serve para decidir: há .dart com NUL e texto em cp1252
+    """
+    return Path(rel).suffix.lower() in BINARY_SUFFIXES
+
+
+def count_lines(text):
+    return text.count('\n') + (1 if text and not text.endswith('\n') else 0)
+
+
+class CodemodError(Exception):
+    pass
+
+
+class Codemod:
+    """Conjunto de mudanças planejadas sobre a árvore do projeto"""
+
+    def __init__(self, name, root=REPO_ROOT, apply=False, snapshot=True):
+        self.name = name
+        self.root = Path(root).resolve()
+        self.apply = apply
+        self.snapshot = snapshot
+        self.last_snapshot = None
+        self._encodings = {}
+        self._write_encodings = {}
+        # caminho relativo -> novo conteúdo (str, ou bytes vindos de replace())
+        # ou None para remoção
+        self.changes = {}
+
+    def _rel(self, path):
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.root / path
+        path = path.resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            raise CodemodError(f'Fora do projeto: {path}')
+
+    def read(self, path):
+        """Conteúdo atual considerando as mudanças já planejadas"""
+        rel = self._rel(path)
+        if rel in self.changes:
+            if self.changes[rel] is None:
+                raise CodemodError(f'Arquivo já marcado para remoção: {rel}')
+            content = self.changes[rel]
+            return content.decode(ENCODING, ERRORS) if isinstance(content, bytes) else content
+        return read_text(self.root / rel)
+
+    def write(self, path, content):
+        """Planeja o novo conteúdo: str (texto) ou bytes (gravados como estão)"""
+        rel = self._rel(path)
+        current = self.root / rel
+        if current.exists() and rel not in self.changes:
+            old = current.read_bytes() if isinstance(content, bytes) else read_text(current)
+            if old == content:
+                return
+        self.changes[rel] = content
+
+    def delete(self, path):
+        rel = self._rel(path)
+        if not (self.root / rel).exists():
+            self.changes.pop(rel, None)
+            return
+        self.changes[rel] = None
+
+    # ------------------------------------------------------- substituições em bytes
+
+    def _buffer(self, rel):
+        """Bytes atuais: mudança planejada ou o arquivo mapeado em memória"""
+        if rel in self.changes:
+            content = self.changes[rel]
+            if content is None:
+                raise CodemodError(f'Arquivo já marcado para remoção: {rel}')
+            return content.encode(ENCODING, ERRORS) if isinstance(content, str) else content
+        with open(self.root / rel, 'rb') as f:
+            if f.seek(0, 2) == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def encoding(self, rel, buf=None):
+        """Codificação do arquivo, detectada uma única vez por execução"""
+        if rel not in self._encodings:
+            buf = self._buffer(rel) if buf is None else buf
+            self._encodings[rel] = detect_encoding(buf)
+        return self._encodings[rel]
+
+    def _text_encoding(self, rel, buf):
+        encoding = self.encoding(rel, buf)
+        return 'utf-8' if encoding == 'utf-8-sig' else encoding
+
+    def _write_encoding(self, rel, buf):
+        """Codificação do texto novo sem forma de referência (trecho ASCII)"""
+        if rel not in self._write_encodings:
+            self._write_encodings[rel] = dominant_encoding(buf, self.encoding(rel, buf))
+        return self._write_encodings[rel]
+
+    def _needles(self, rel, buf, text, newline):
+        """
+        Formas em bytes [(codificação, bytes)] em que text pode aparecer no
+        arquivo. Um arquivo UTF-8 com um byte solto em cp1252 é detectado como
+        cp1252, então trechos não-ASCII são procurados nas duas formas. Formas
+        que a codificação não representa (ex.: emoji em cp1252) são ignoradas
+        """
+        if isinstance(text, bytes):
+            return [(None, text)]
+        if newline != '\n':
+            text = with_newline(text, newline)
+        if text.isascii():
+            return [(None, text.encode('ascii'))]
+        forms = []
+        for encoding in dict.fromkeys(('utf-8', self._text_encoding(rel, buf))):
+            try:
+                forms.append((encoding, text.encode(encoding, ERRORS)))
+            except UnicodeEncodeError:
+                continue
+        return forms
+
+    def _encode(self, rel, buf, text, newline, encoding=None):
+        """text na codificação do trecho encontrado (ou na predominante do arquivo)"""
+        if isinstance(text, bytes):
+            return text
+        if newline != '\n':
+            text = with_newline(text, newline)
+        if text.isascii():
+            return text.encode('ascii')
+        encoding = encoding or self._write_encoding(rel, buf)
+        try:
+            return text.encode(encoding, ERRORS)
+        except UnicodeEncodeError as e:
+            raise CodemodError(f'{rel}: {e.object[e.start:e.end]!r} não é representável em {encoding}')
+
+    def replace(self, path, old, new, count=-1, tolerant=False):
+        """
+        Substitui old por new nos bytes do arquivo e devolve quantas trocas
+        foram feitas (0 = trecho não encontrado). old/new em str são
+        codificados na codificação do arquivo e adaptados à quebra de linha
+        dele; bytes são usados como estão. tolerant=True ignora diferenças em
+        espaços, quebras de linha e caracteres de controle
+        """
+        rel = self._rel(path)
+        buf = self._buffer(rel)
+        try:
+            newline = detect_newline_bytes(buf)
+            needles = self._needles(rel, buf, old, newline)
+            if any(not needle for _, needle in needles):
+                raise CodemodError('Trecho vazio')
+            hits = []
+            for encoding, needle in needles:
+                if tolerant:
+                    spans = self._loose_spans(buf, needle, count)
+                else:
+                    spans = self._exact_spans(buf, needle, count)
+                hits += [(start, end, encoding) for start, end in spans]
+            # ocorrências das várias formas, em ordem e sem sobreposição
+            spans, last = [], 0
+            for start, end, encoding in sorted(hits):
+                if start >= last and count != len(spans):
+                    spans.append((start, end, encoding))
+                    last = end
+            if not spans:
+                return 0
+            replacements = {encoding: self._encode(rel, buf, new, newline, encoding)
+                            for encoding in {encoding for _, _, encoding in spans}}
+            if not tolerant and all(replacements[enc] == needle for enc, needle in needles
+                                    if enc in replacements):
+                return len(spans)
+            with memoryview(buf) as view:
+                pieces, last = [], 0
+                for start, end, encoding in spans:
+                    pieces += [view[last:start], replacements[encoding]]
+                    last = end
+                pieces.append(view[last:])
+                content = b''.join(pieces)
+                del pieces
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+        self.changes[rel] = content
+        return len(spans)
+
+    @staticmethod
+    def _exact_spans(buf, needle, count):
+        spans, i = [], buf.find(needle)
+        while i >= 0 and count != len(spans):
+            spans.append((i, i + len(needle)))
+            i = buf.find(needle, i + len(needle))
+        return spans
+
+    @staticmethod
+    def _loose_spans(buf, needle, count):
+        # pré-filtro barato: o maior pedaço literal precisa existir
+        literal = max(_LOOSE_RE.split(needle), key=len)
+        if literal and buf.find(literal) < 0:
+            return []
+        spans = []
+        for m in _loose_pattern(needle).finditer(buf):
+            if count == len(spans):
+                break
+            spans.append(m.span())
+        return spans
+
+    def replace_in_tree(self, pattern, old, new, tolerant=False):
+        """
+        replace() em todos os arquivos que casam com o glob (ex.: 'lib/**/*.dart').
+        Arquivos sem o trecho são descartados só com um find no mmap, sem
+        decodificar nada. Devolve {arquivo: trocas}
+        """
+        counts = {}
+        for path in sorted(self.root.glob(pattern)):
+            if path.is_file():
+                n = self.replace(path, old, new, tolerant=tolerant)
+                if n:
+                    counts[self._rel(path)] = n
+        return counts
+
+    def summary(self):
+        """
+        Linhas (arquivo, ação, +linhas, -linhas) para exibição. Para arquivos
+        binários (imagens, ícones) os números são bytes: (arquivo, ação, novo, antigo)
+        """
+        rows = []
+        for rel in sorted(self.changes):
+            content = self.changes[rel]
+            target = self.root / rel
+            if is_binary(rel):
+                old_size = target.stat().st_size if target.exists() else 0
+                if content is None:
+                    rows.append((rel, 'remove', 0, old_size))
+                else:
+                    rows.append((rel, 'cria' if not target.exists() else 'altera', len(content), old_size))
+                continue
+            old = read_text(target) if target.exists() else ''
+            if content is None:
+                rows.append((rel, 'remove', 0, count_lines(old)))
+                continue
+            if isinstance(content, bytes):
+                content = content.decode(ENCODING, ERRORS)
+            old_lines = old.splitlines()
+            new_lines = content.splitlines()
+            old_set, new_set = set(old_lines), set(new_lines)
+            added = sum(1 for l in new_lines if l not in old_set)
+            removed = sum(1 for l in old_lines if l not in new_set)
+            rows.append((rel, 'cria' if not target.exists() else 'altera', added, removed))
+        return rows
+
+    def print_summary(self):
+        rows = self.summary()
+        print(f'\n📝 Codemod "{self.name}": {len(rows)} arquivo(s)')
+        for rel, action, added, removed in rows:
+            if is_binary(rel):
+                print(f'   {action:<7} {rel}  ({removed} -> {added} bytes)')
+            else:
+                print(f'   {action:<7} {rel}  (+{added} -{removed})')
+
+    def commit(self):
+        """Mostra o resumo e, se apply=True, grava as mudanças no disco"""
+        self.print_summary()
+        if not self.changes:
+            return 0
+        if not self.apply:
+            print('\n💡 Dry-run: nada foi gravado. Use --apply para aplicar.')
+            return 0
+        if self.snapshot:
+            manifest = SnapshotStore(self.root).snapshot(self.name, self.changes)
+            self.last_snapshot = manifest
+            print(f'\n📸 Snapshot {manifest["id"]} ({format_size(manifest["stored_bytes"])} novos).'
+                  f' Para desfazer: python scripts/snapshot_store.py restore {manifest["id"]} --apply')
+        for rel, content in sorted(self.changes.items()):
+            target = self.root / rel
+            if content is None:
+                target.unlink()
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if isinstance(content, str):
+                    content = content.encode(ENCODING, ERRORS)
+                target.write_bytes(content)
+        print(f'\n✅ {len(self.changes)} arquivo(s) gravados')
+        applied = len(self.changes)
+        self.changes = {}
+        return applied
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Grafo de imports/exports/parts dos arquivos Dart de lib/
+
+Usado pelos codemods que precisam saber quem importa quem (reachability,
+divisão de arquivos grandes). A análise é textual: diretivas são lidas por
+regex e URIs são resolvidas para caminhos relativos à raiz do projeto.
+"""
+
+import posixpath
+import re
+from pathlib import Path
+
+from codemod import REPO_ROOT, read_text
+from dart_scanner import code_only, top_level_declarations
+
+PACKAGE_NAME = 'my_business'
+
+DIRECTIVE_RE = re.compile(
+    r"""^[ \t]*(?P<kind>import|export|part(?![ \t]+of))[ \t]+(?P<q>['"])(?P<uri>[^'"]+)(?P=q)(?P<rest>[^;]*);[ \t]*\r?\n?""",
+    re.MULTILINE,
+)
+CONDITIONAL_URI_RE = re.compile(r"""\bif\s*\([^)]*\)\s*['"]([^'"]+)['"]""")
+SHOW_RE = re.compile(r'\bshow\s+([\w\s,]+?)(?:\bhide\b|$)')
+HIDE_RE = re.compile(r'\bhide\s+([\w\s,]+?)(?:\bshow\b|$)')
+IDENTIFIER_RE = re.compile(r'[A-Za-z_$][\w$]*')
+
+
+class Directive:
+    """Uma diretiva import/export/part dentro de um arquivo"""
+
+    def __init__(self, kind, uri, rest, start, end, targets):
+        self.kind = kind
+        self.uri = uri
+        self.rest = rest
+        self.start = start
+        self.end = end
+        self.targets = targets  # caminhos resolvidos (inclui imports condicionais)
+
+    @property
+    def show(self):
+        m = SHOW_RE.search(self.rest)
+        return {n.strip() for n in m.group(1).split(',') if n.strip()} if m else None
+
+    @property
+    def hide(self):
+        m = HIDE_RE.search(self.rest)
+        return {n.strip() for n in m.group(1).split(',') if n.strip()} if m else set()
+
+    @property
+    def prefix(self):
+        m = re.search(r'\bas\s+(\w+)', self.rest)
+        return m.group(1) if m else None
+
+
+def resolve_uri(uri, from_file):
+    """Resolve a URI de uma diretiva para um caminho relativo à raiz (ou None)"""
+    if uri.startswith('dart:'):
+        return None
+    if uri.startswith('package:'):
+        package, _, rest = uri[len('package:'):].partition('/')
+        return f'lib/{rest}' if package == PACKAGE_NAME else None
+    base = posixpath.dirname(from_file)
+    return posixpath.normpath(posixpath.join(base, uri))
+
+
+def relative_uri(from_file, to_file):
+    """URI relativa (estilo do projeto) de from_file para to_file"""
+    return posixpath.relpath(to_file, posixpath.dirname(from_file))
+
+
+def parse_directives(rel, text):
+    directives = []
+    for m in DIRECTIVE_RE.finditer(text):
+        uris = [m.group('uri')] + CONDITIONAL_URI_RE.findall(m.group('rest'))
+        targets = [t for t in (resolve_uri(u, rel) for u in uris) if t]
+        directives.append(Directive(m.group('kind'), m.group('uri'), m.group('rest'),
+                                    m.start(), m.end(), targets))
+    return directives
+
+
+def declared_names(declarations):
+    """
+    Identificadores públicos declarados no topo do arquivo (profundidade de
+    chaves 0; membros e variáveis locais das classes não contam)
+    """
+    return {name for _, name in declarations if name and not name.startswith('_')}
+
+
+class DartFile:
+    def __init__(self, rel, text):
+        self.rel = rel
+        self.text = text
+        self.lines = text.count('\n') + (1 if text and not text.endswith('\n') else 0)
+        self.directives = parse_directives(rel, text)
+        self._declarations = None
+        self._names = None
+        self._tokens = None
+
+    @property
+    def declarations(self):
+        """[(tipo, nome)] das declarações de topo"""
+        if self._declarations is None:
+            self._declarations = top_level_declarations(self.text)
+        return self._declarations
+
+    @property
+    def names(self):
+        if self._names is None:
+            self._names = declared_names(self.declarations)
+        return self._names
+
+    @property
+    def tokens(self):
+        """Identificadores usados no código (sem diretivas, comentários e strings)"""
+        if self._tokens is None:
+            body = code_only(DIRECTIVE_RE.sub('', self.text))
+            self._tokens = set(IDENTIFIER_RE.findall(body))
+        return self._tokens
+
+    @property
+    def has_extension(self):
+        return any(kind == 'extension' for kind, _ in self.declarations)
+
+    def edges(self, kinds=('import', 'export', 'part')):
+        for d in self.directives:
+            if d.kind in kinds:
+                for target in d.targets:
+                    yield d, target
+
+
+class DartProject:
+    """Todos os arquivos .dart de lib/ (e opcionalmente test/) com o grafo de diretivas"""
+
+    def __init__(self, root=REPO_ROOT, dirs=('lib',)):
+        self.root = Path(root)
+        self.files = {}
+        for d in dirs:
+            for path in sorted((self.root / d).rglob('*.dart')):
+                rel = path.relative_to(self.root).as_posix()
+                self.files[rel] = DartFile(rel, read_text(path))
+
+    def dependents(self, target):
+        """Arquivos com alguma diretiva apontando para target"""
+        result = []
+        for rel, dart in self.files.items():
+            for d, t in dart.edges():
+                if t == target:
+                    result.append((rel, d))
+        return result
+
+    def closure(self, roots, kinds=('import', 'export', 'part')):
+        """Fecho transitivo a partir das raízes"""
+        seen = set()
+        stack = [r for r in roots if r in self.files]
+        while stack:
+            rel = stack.pop()
+            if rel in seen:
+                continue
+            seen.add(rel)
+            for _, target in self.files[rel].edges(kinds):
+                if target in self.files and target not in seen:
+                    stack.append(target)
+        return seen
+
+    def namespace(self, rel, show=None, hide=frozenset(), via=None, _chain=(), _seen=None):
+        """
+        Arquivos cujas declarações ficam visíveis ao importar rel, seguindo os
+        exports (barrels como lib/ui/ui.dart). Retorna {arquivo: nomes visíveis}
+        Se via for um dict, recebe {arquivo: barrels atravessados até ele}
+        """
+        _seen = set() if _seen is None else _seen
+        if rel in _seen or rel not in self.files:
+            return {}
+        _seen.add(rel)
+        dart = self.files[rel]
+        names = set(dart.names)
+        for d, target in dart.edges(('part',)):
+            if target in self.files:
+                names |= self.files[target].names
+        result = {rel: names}
+        if via is not None:
+            via.setdefault(rel, _chain)
+        for d, target in dart.edges(('export',)):
+            child = self.namespace(target, d.show, d.hide, via, _chain + (rel,), _seen)
+            for file, exported in child.items():
+                result[file] = result.get(file, set()) | exported
+        for file in list(result):
+            visible = result[file]
+            if show is not None:
+                visible = visible & show
+            result[file] = visible - set(hide)
+        return result
+
+    def with_changes(self, changes):
+        """Cópia do projeto com mudanças planejadas ({arquivo: conteúdo ou None})"""
+        clone = DartProject.__new__(DartProject)
+        clone.root = self.root
+        clone.files = dict(self.files)
+        for rel, content in changes.items():
+            if content is None:
+                clone.files.pop(rel, None)
+            elif rel.endswith('.dart'):
+                clone.files[rel] = DartFile(rel, content)
+        return clone
+
+    def library_of(self, rel):
+        """Arquivo de biblioteca ao qual rel pertence (o próprio, ou o dono do part)"""
+        for owner, dart in self.files.items():
+            for d, target in dart.edges(('part',)):
+                if target == rel:
+                    return owner
+        return rel
+
+    def library_lines(self, library):
+        """Linhas compiladas juntas: a biblioteca mais os seus parts"""
+        dart = self.files[library]
+        return dart.lines + sum(
+            self.files[t].lines for _, t in dart.edges(('part',)) if t in self.files
+        )
+
+    def importers_closure(self, library):
+        """Bibliotecas que dependem (transitivamente) de library via import/export"""
+        reverse = {}
+        for rel, dart in self.files.items():
+            for _, target in dart.edges(('import', 'export')):
+                reverse.setdefault(target, set()).add(rel)
+        seen, stack = set(), [library]
+        while stack:
+            for importer in reverse.get(stack.pop(), ()):
+                if importer not in seen and importer != library:
+                    seen.add(importer)
+                    stack.append(importer)
+        return seen
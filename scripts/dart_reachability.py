@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Reachability a partir de lib/main.dart: encontra arquivos Dart mortos
+
+Depois das migrações para atomic design e monolito modular sobraram arquivos
+que ninguém importa, e barrels (lib/ui/ui.dart, lib/modules/modules.dart, ...)
+que reexportam arquivos que ninguém usa. Tudo isso ainda é analisado e, no caso
+dos exports, compilado.
+
+O relatório tem duas seções:
+    1. Inalcançáveis - fora do fecho transitivo de import/export/part a partir
+       das raízes. Nada compilado depende deles: remoção segura.
+    2. Só vivos por export - entram no fecho apenas porque um barrel os
+       reexporta, mas nenhum arquivo alcançável usa um nome declarado neles
+       (análise por identificadores, heurística). O export pode sair.
+
+Raízes: lib/main.dart e os testes de test/ (para não quebrar `flutter test`).
+
+Uso:
+    python scripts/dart_reachability.py
+    python scripts/dart_reachability.py --json build/reachability.json
+    python scripts/dart_reachability.py --apply                  # remove a seção 1
+    python scripts/dart_reachability.py --apply --prune-exports  # remove 1 e 2
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from codemod import REPO_ROOT, Codemod
+from dart_imports import DartProject
+
+
+def used_closure(project, roots):
+    """
+    Arquivos efetivamente usados: a partir das raízes, um arquivo visível por
+    um import só entra se o importador referencia algum nome declarado nele
+    (arquivos com extensions entram sempre, pois o uso não cita o nome)
+    """
+    used = set()
+    stack = [r for r in roots if r in project.files]
+    namespaces = {}
+    while stack:
+        rel = stack.pop()
+        if rel in used:
+            continue
+        used.add(rel)
+        consumer = project.files[rel]
+        for d, target in consumer.edges(('import', 'part')):
+            if target not in project.files:
+                continue
+            if d.kind == 'part':
+                stack.append(target)
+                continue
+            key = (target, frozenset(d.show) if d.show is not None else None, frozenset(d.hide))
+            if key not in namespaces:
+                via = {}
+                namespaces[key] = (project.namespace(target, d.show, d.hide, via), via)
+            namespace, via = namespaces[key]
+            for file, names in namespace.items():
+                if project.files[file].has_extension or names & consumer.tokens:
+                    stack.append(file)
+                    stack.extend(via.get(file, ()))
+    return used
+
+
+def analyze(project, roots):
+    compiled = project.closure(roots)
+    used = used_closure(project, roots)
+    lib_files = {rel for rel in project.files if rel.startswith('lib/')}
+
+    unreachable = sorted(lib_files - compiled)
+    export_only = sorted((lib_files & compiled) - used)
+    export_only_set = set(export_only)
+
+    # Diretivas export em arquivos mantidos que apontam para arquivos só vivos por export
+    dead_exports = []
+    for rel in sorted(used):
+        for d, target in project.files[rel].edges(('export',)):
+            if target in export_only_set:
+                dead_exports.append((rel, d.uri, target))
+    return unreachable, export_only, dead_exports
+
+
+def remove_directives(text, directives):
+    """Remove as diretivas informadas (de trás para frente, preservando offsets)"""
+    for d in sorted(directives, key=lambda d: -d.start):
+        text = text[:d.start] + text[d.end:]
+    return text
+
+
+def prune(project, removed, apply):
+    """Remove arquivos e as diretivas que apontam para eles via codemod"""
+    run = Codemod('dart-reachability', apply=apply)
+    removed = set(removed)
+    for rel in sorted(removed):
+        run.delete(rel)
+    for rel, dart in project.files.items():
+        if rel in removed:
+            continue
+        stale = [d for d in dart.directives if d.targets and all(t in removed for t in d.targets)]
+        if stale:
+            run.write(rel, remove_directives(dart.text, stale))
+    return run.commit()
+
+
+def print_section(title, files, project):
+    total = sum(project.files[f].lines for f in files)
+    print(f'\n{title}: {len(files)} arquivo(s), {total} linhas')
+    for rel in sorted(files, key=lambda f: -project.files[f].lines):
+        print(f'   {project.files[rel].lines:>6}  {rel}')
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Arquivos Dart inalcançáveis a partir de lib/main.dart')
+    parser.add_argument('--root', action='append', help='raiz extra (padrão: lib/main.dart + test/)')
+    parser.add_argument('--no-tests', action='store_true', help='não usa test/ como raiz')
+    parser.add_argument('--json', help='salva o relatório em JSON')
+    parser.add_argument('--apply', action='store_true', help='remove os arquivos inalcançáveis')
+    parser.add_argument('--prune-exports', action='store_true',
+                        help='com --apply, remove também os arquivos só vivos por export')
+    args = parser.parse_args(argv)
+
+    dirs = ('lib',) if args.no_tests else ('lib', 'test')
+    project = DartProject(REPO_ROOT, dirs)
+    roots = ['lib/main.dart'] + (args.root or [])
+    if not args.no_tests:
+        roots += [rel for rel in project.files if rel.startswith('test/')]
+    missing = [r for r in roots if r not in project.files]
+    if missing:
+        print(f'❌ Raiz não encontrada: {", ".join(missing)}')
+        return 1
+
+    lib_count = sum(1 for rel in project.files if rel.startswith('lib/'))
+    print(f'🔎 {lib_count} arquivos em lib/, raízes: {len(roots)}')
+    unreachable, export_only, dead_exports = analyze(project, roots)
+
+    dead_lines = print_section('🗑️  Inalcançáveis', unreachable, project)
+    export_lines = print_section('📦 Só vivos por export (nenhum nome usado)', export_only, project)
+    if dead_exports:
+        print(f'\n   Exports removíveis ({len(dead_exports)}):')
+        for barrel, uri, _ in dead_exports:
+            print(f"      {barrel}: export '{uri}';")
+
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps({
+            'roots': roots,
+            'unreachable': [{'file': f, 'lines': project.files[f].lines} for f in unreachable],
+            'export_only': [{'file': f, 'lines': project.files[f].lines} for f in export_only],
+            'dead_exports': [{'barrel': b, 'uri': u, 'target': t} for b, u, t in dead_exports],
+        }, indent=2), encoding='utf-8')
+        print(f'\n📝 Relatório: {out}')
+
+    print(f'\n✨ Total removível: {dead_lines} linhas inalcançáveis'
+          f' + {export_lines} linhas só vivas por export')
+
+    if args.apply or args.prune_exports:
+        removed = unreachable + (export_only if args.prune_exports else [])
+        prune(project, removed, args.apply)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
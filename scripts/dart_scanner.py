@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Scanner de código Dart compartilhado pelos codemods
+
+Percorre o texto respeitando strings (com interpolação) e comentários
+aninhados, divide o arquivo nos pedaços de topo (profundidade de chaves 0) e
+extrai de cada pedaço o nome declarado. Usado por dart_imports.py (nomes
+declarados no topo de cada arquivo) e split_dart_file.py (divisão por classe).
+"""
+
+import re
+
+IDENT_RE = re.compile(r'[A-Za-z_$][\w$]*')
+TYPE_HEAD_RE = re.compile(
+    r'^(?:(?:abstract|sealed|base|final|interface|mixin|macro)\s+)*'
+    r'(?P<kind>class|mixin|enum|extension\s+type|extension|typedef)\b\s*(?P<name>[A-Za-z_$][\w$]*)?'
+)
+LEADING_TRIVIA_RE = re.compile(
+    r'\A(?:\s+|//[^\n]*\n?|/\*.*?\*/|@[\w.]+(?:\([^)]*\))?)*', re.DOTALL
+)
+MEMBER_DECL_RE = re.compile(
+    r'^  (?=\S)(?:@\w+\s+)*(?:(?:static|final|late|const|external|factory|covariant)\s+)*'
+    r'(?:[\w$<>?,.\[\] ]+?\s+)?(?:get\s+|set\s+)?(?:[A-Za-z_$][\w$]*\.)?(?P<name>_[\w$]*)\s*(?:[;=({]|=>)',
+    re.MULTILINE,
+)
+DOT_PRIVATE_RE = re.compile(r'\.\s*(_[\w$]+)')
+MEMBER_KINDS = ('class', 'mixin', 'enum', 'extension')
+DIRECTIVE_HEAD_RE = re.compile(r'(?:import|export|part|library)\b')
+
+
+# ============================================================================
+# Scanner de código Dart (strings com interpolação, comentários aninhados)
+# ============================================================================
+
+def _is_string_start(text, i):
+    ch = text[i]
+    if ch in '\'"':
+        return True
+    if ch in 'rR' and i + 1 < len(text) and text[i + 1] in '\'"':
+        return i == 0 or not (text[i - 1].isalnum() or text[i - 1] in '_$')
+    return False
+
+
+def _skip_comment(text, i):
+    """Índice após o comentário em text[i] (ou i se não houver comentário)"""
+    if text.startswith('//', i):
+        nl = text.find('\n', i)
+        return len(text) if nl == -1 else nl + 1
+    if text.startswith('/*', i):
+        depth, j = 1, i + 2
+        while j < len(text) and depth:
+            if text.startswith('/*', j):
+                depth, j = depth + 1, j + 2
+            elif text.startswith('*/', j):
+                depth, j = depth - 1, j + 2
+            else:
+                j += 1
+        return j
+    return i
+
+
+def scan_string(text, i, code_out=None):
+    """
+    Índice após a string literal em text[i]. Se code_out for uma lista, recebe
+    o código das interpolações ($nome e ${...}), que conta como uso de nomes
+    """
+    raw = text[i] in 'rR'
+    if raw:
+        i += 1
+    quote = text[i]
+    delim = quote * 3 if text.startswith(quote * 3, i) else quote
+    j, n = i + len(delim), len(text)
+    while j < n:
+        if not raw and text[j] == '\\':
+            j += 2
+            continue
+        if text.startswith(delim, j):
+            return j + len(delim)
+        if not raw and text[j] == '$':
+            if text.startswith('${', j):
+                end = scan_code(text, j + 2, code_out, until_brace=True)
+                j = end
+                continue
+            m = IDENT_RE.match(text, j + 1)
+            if m and code_out is not None:
+                code_out.append(' ' + m.group(0) + ' ')
+        if len(delim) == 1 and text[j] == '\n':
+            return j + 1
+        j += 1
+    return n
+
+
+def scan_code(text, i, code_out=None, until_brace=False):
+    """
+    Percorre código a partir de i. Com until_brace, para após o '}' que fecha
+    uma interpolação. Se code_out for uma lista, recebe o código sem strings
+    e comentários
+    """
+    depth, n, start = 0, len(text), i
+    while i < n:
+        if _is_string_start(text, i):
+            if code_out is not None:
+                code_out.append(text[start:i] + ' ')
+            i = scan_string(text, i, code_out)
+            start = i
+            continue
+        end = _skip_comment(text, i)
+        if end != i:
+            if code_out is not None:
+                # mantém as quebras de linha: regex ancoradas em ^ (membros) dependem delas
+                code_out.append(text[start:i] + ('\n' * text.count('\n', i, end) or ' '))
+            i = start = end
+            continue
+        ch = text[i]
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            if until_brace and depth == 0:
+                if code_out is not None:
+                    code_out.append(text[start:i] + ' ')
+                return i + 1
+            depth -= 1
+        i += 1
+    if code_out is not None:
+        code_out.append(text[start:n])
+    return n
+
+
+def code_only(text):
+    """Código sem comentários e sem o conteúdo das strings (mantém interpolações)"""
+    out = []
+    scan_code(text, 0, out)
+    return ''.join(out)
+
+
+def _next_significant(text, i):
+    while i < len(text):
+        if text[i].isspace():
+            i += 1
+            continue
+        end = _skip_comment(text, i)
+        if end == i:
+            return i
+        i = end
+    return i
+
+
+def top_level_chunks(text):
+    """Divide o arquivo em pedaços de topo: (início, fim). Comentários vão com o pedaço seguinte"""
+    chunks, start, depth, i, n = [], 0, 0, 0, len(text)
+    while i < n:
+        if _is_string_start(text, i):
+            i = scan_string(text, i)
+            continue
+        end = _skip_comment(text, i)
+        if end != i:
+            i = end
+            continue
+        ch = text[i]
+        if ch in '([{':
+            depth += 1
+        elif ch in ')]}':
+            depth -= 1
+            if depth == 0 and ch == '}':
+                j = _next_significant(text, i + 1)
+                if j >= n or text[j] not in ';.,)?:=':
+                    chunks.append((start, i + 1))
+                    start = i + 1
+        elif ch == ';' and depth == 0:
+            chunks.append((start, i + 1))
+            start = i + 1
+        i += 1
+    return _detach_comments(text, chunks), start
+
+
+def _detach_comments(text, chunks):
+    """
+    Comentários separados da declaração por linha em branco (ex.: código antigo
+    comentado) viram um pedaço próprio, que fica no arquivo original; doc
+    comments colados na declaração seguem junto com ela
+    """
+    adjusted = []
+    for k, (start, end) in enumerate(chunks):
+        i, split = start, None
+        while k and i < end:
+            if text[i].isspace():
+                j = i
+                while j < end and text[j].isspace():
+                    j += 1
+                if text.count('\n', i, j) >= 2:
+                    split = text.index('\n', i) + 1
+                i = j
+                continue
+            after = _skip_comment(text, i)
+            if after == i:
+                break
+            i = after
+        if split is not None and text[start:split].strip():
+            adjusted.append((start, split))
+            adjusted.append((split, end))
+        else:
+            adjusted.append((start, end))
+    return adjusted
+
+
+# ============================================================================
+# Declarações de topo
+# ============================================================================
+
+def declaration_name(head):
+    """(tipo, nome) de uma declaração de topo já sem comentários e anotações"""
+    m = TYPE_HEAD_RE.match(head)
+    if m:
+        kind = m.group('kind').split()[0]
+        name = m.group('name')
+        if kind == 'extension' and name == 'on':
+            return kind, None  # extension sem nome: só visível na própria biblioteca
+        if kind == 'typedef':
+            old_style = re.match(r'typedef\s+[\w<>?, ]+?\s+(\w+)\s*[(<]', head)
+            if old_style and '=' not in head.split('(')[0]:
+                name = old_style.group(1)
+        return kind, name
+    signature = re.split(r'[({=;]|=>', head, maxsplit=1)[0]
+    names = [n for n in IDENT_RE.findall(signature) if n not in ('get', 'set', 'operator', 'external')]
+    return 'member', names[-1] if names else None
+
+
+def top_level_declarations(text):
+    """
+    [(tipo, nome)] das declarações de topo do arquivo (profundidade de chaves
+    0): métodos, variáveis locais e construtores dentro das classes não entram
+    """
+    chunks, _ = top_level_chunks(text)
+    result = []
+    for start, end in chunks:
+        chunk = text[start:end]
+        head = chunk[LEADING_TRIVIA_RE.match(chunk).end():]
+        if not head or DIRECTIVE_HEAD_RE.match(head):
+            continue
+        result.append(declaration_name(head))
+    return result
+
+
+class Decl:
+    def __init__(self, text, start, end):
+        self.text = text
+        self.start = start
+        self.end = end
+        head = text[LEADING_TRIVIA_RE.match(text).end():]
+        self.is_directive = bool(DIRECTIVE_HEAD_RE.match(head))
+        self.is_import = head.startswith('import')
+        self.kind, self.name = declaration_name(head)
+        code = code_only(text)
+        self.tokens = set(IDENT_RE.findall(code))
+        self.dot_private = set(DOT_PRIVATE_RE.findall(code))
+        # membros privados (inclui construtores nomeados: Registry._internal())
+        self.private_members = (
+            set(MEMBER_DECL_RE.findall(code)) - {'_'} if self.kind in MEMBER_KINDS else set()
+        )
+        self.lines = text.strip('\n').count('\n') + 1
+
+    @property
+    def is_private(self):
+        return self.name is None or self.name.startswith('_')
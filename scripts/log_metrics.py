@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Analisador de logs em streaming: transforma marcadores de debugPrint em métricas
+
+Lê a saída do `flutter run` (stdin) ou arquivos de log capturados, linha a linha e
+com memória constante, e imprime periodicamente:
+    - frequência de rebuild por widget ([GB] didUpdateWidget(index=...), build, ...)
+    - latência entre eventos de início e fim pareados (debounce -> commit do
+      _GBBlockWidget, uploads do UploadManager, start/stop do TaskTimerService)
+
+Cada métrica mantém histogramas em buckets logarítmicos fixos: um acumulado da
+sessão e uma janela deslizante de N intervalos. Quando o p95 da janela passa do
+p95 da sessão por uma margem, a linha é marcada como regressão.
+
+Uso:
+    flutter run -d windows 2>&1 | python scripts/log_metrics.py -
+    python scripts/log_metrics.py logs/sessao.log
+    python scripts/log_metrics.py --follow logs/sessao.log --interval 30
+    python scripts/log_metrics.py --rules minhas_regras.json -
+
+Regras extras (JSON, lista de objetos):
+    {"name": "sync", "kind": "pair",
+     "start": "\\\\[Sync\\\\] start id=(?P<key>\\\\S+)", "end": "\\\\[Sync\\\\] done id=(?P<key>\\\\S+)"}
+    {"name": "rebuild", "kind": "counter", "pattern": "\\\\[(?P<key>\\\\w+)\\\\] build"}
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+
+# Prefixos adicionados pelo flutter run / logcat antes do texto do debugPrint
+LOG_PREFIX_RE = re.compile(r'^(?:I/flutter\s*\(\s*\d+\):\s*|flutter:\s*)')
+# Timestamp no início da linha (logs capturados com data ou hora)
+TIMESTAMP_RE = re.compile(
+    r'^\[?(?:(?P<date>\d{4}-\d{2}-\d{2})[T ])?(?P<time>\d{2}:\d{2}:\d{2}(?:[.,]\d{1,6})?)\]?\s*'
+)
+
+# Recuo maior que isso num horário sem data é virada de dia, não desordem
+DAY_ROLLOVER = 12 * 3600
+
+DEFAULT_RULES = [
+    {
+        'name': 'rebuild',
+        'kind': 'counter',
+        'pattern': r'\[(?P<widget>[\w.]+)\]\s*(?:build|didUpdateWidget)\((?:index=(?P<index>\d+))?',
+        'key': '{widget}#{index}',
+    },
+    {
+        'name': 'debounce_commit',
+        'kind': 'pair',
+        'start': r'\[_GBBlockWidget\._on(?:Text|Content)Changed\](?:.*?index=(?P<key>\d+))?',
+        # ex.: [_GBBlockWidget._onTextChanged] CHAMANDO widget.onChanged após debounce
+        'end': r'\[(?:GB|_GBBlockWidget[\w.]*)\][^\n]*?\b(?:commit|onChanged)\b(?:.*?index=(?P<key>\d+))?',
+        'match': 'last',
+    },
+    {
+        'name': 'upload',
+        'kind': 'pair',
+        'start': r'\[(?:UploadManager|Upload)\][^\n]*?\b(?:start\w*|iniciando)\b(?:.*?\b(?:fileId|file|id)[=:]\s*(?P<key>[^\s,)]+))?',
+        'end': r'\[(?:UploadManager|Upload)\][^\n]*?\b(?:done|finish\w*|complete\w*|conclu\w*|fail\w*|erro\w*)\b(?:.*?\b(?:fileId|file|id)[=:]\s*(?P<key>[^\s,)]+))?',
+        'match': 'first',
+    },
+    {
+        'name': 'timer',
+        'kind': 'pair',
+        'start': r'\[(?:TaskTimerService|TaskTimer)\][^\n]*?\bstart\b(?:.*?\btask(?:Id)?[=:]\s*(?P<key>[^\s,)]+))?',
+        'end': r'\[(?:TaskTimerService|TaskTimer)\][^\n]*?\bstop\b(?:.*?\btask(?:Id)?[=:]\s*(?P<key>[^\s,)]+))?',
+        'match': 'first',
+    },
+]
+
+
+class LogHistogram:
+    """Histograma com buckets logarítmicos fixos (memória constante)"""
+
+    MIN_MS = 0.1
+    FACTOR = 1.25
+    BUCKETS = 80  # 0.1 ms .. ~5.7 h
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.total = 0
+
+    @classmethod
+    def bucket_of(cls, value_ms):
+        if value_ms <= cls.MIN_MS:
+            return 0
+        index = int(math.log(value_ms / cls.MIN_MS, cls.FACTOR)) + 1
+        return min(index, cls.BUCKETS - 1)
+
+    @classmethod
+    def upper_bound(cls, index):
+        return cls.MIN_MS * cls.FACTOR ** index
+
+    def add(self, value_ms):
+        self.counts[self.bucket_of(value_ms)] += 1
+        self.total += 1
+
+    def merge(self, other):
+        for i, c in enumerate(other.counts):
+            self.counts[i] += c
+        self.total += other.total
+
+    def percentile(self, pct):
+        if not self.total:
+            return 0.0
+        target = max(1, math.ceil(pct / 100.0 * self.total))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return self.upper_bound(i)
+        return self.upper_bound(self.BUCKETS - 1)
+
+    def bars(self, width=30):
+        """Linhas de histograma ASCII apenas para os buckets ocupados"""
+        used = [i for i, c in enumerate(self.counts) if c]
+        if not used:
+            return []
+        peak = max(self.counts)
+        lines = []
+        for i in range(used[0], used[-1] + 1):
+            bar = '#' * max(1 if self.counts[i] else 0, round(self.counts[i] / peak * width))
+            lines.append(f'      <= {format_ms(self.upper_bound(i)):>9} | {bar} {self.counts[i]}')
+        return lines
+
+
+class SpaceSaving:
+    """Contador top-k aproximado (Space-Saving) com número máximo de chaves"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = {}
+
+    def add(self, key, n=1):
+        if key in self.counts or len(self.counts) < self.capacity:
+            self.counts[key] = self.counts.get(key, 0) + n
+            return
+        victim = min(self.counts, key=self.counts.get)
+        self.counts[key] = self.counts.pop(victim) + n
+
+    def top(self, n):
+        return sorted(self.counts.items(), key=lambda kv: -kv[1])[:n]
+
+    def merge(self, other):
+        for key, count in other.counts.items():
+            self.add(key, count)
+
+
+class Window:
+    """Janela deslizante de N intervalos, cada um com seu próprio agregado"""
+
+    def __init__(self, slots, factory):
+        self.factory = factory
+        self.slots = deque([factory()], maxlen=slots)
+
+    @property
+    def current(self):
+        return self.slots[-1]
+
+    def rotate(self):
+        self.slots.append(self.factory())
+
+    def merged(self):
+        total = self.factory()
+        for slot in self.slots:
+            total.merge(slot)
+        return total
+
+
+class CounterMetric:
+    def __init__(self, rule, window_slots, max_keys):
+        self.name = rule['name']
+        self.pattern = re.compile(rule['pattern'])
+        self.key_template = rule.get('key')
+        self.session = SpaceSaving(max_keys)
+        self.window = Window(window_slots, lambda: SpaceSaving(max_keys))
+
+    def feed(self, text, _ts):
+        m = self.pattern.search(text)
+        if not m:
+            return
+        groups = {k: (v or '') for k, v in m.groupdict().items()}
+        if self.key_template:
+            key = self.key_template.format(**groups).rstrip('#')
+        else:
+            key = groups.get('key') or m.group(0)
+        self.session.add(key)
+        self.window.current.add(key)
+
+    def report(self, window_seconds, top):
+        window = self.window.merged()
+        lines = [f'🔁 {self.name} (top {top}, janela de {window_seconds:.0f}s)']
+        for key, count in window.top(top):
+            rate = count / window_seconds if window_seconds else 0.0
+            lines.append(f'    {key:<40} {count:>7} na janela  {rate:>7.2f}/s  '
+                         f'{self.session.counts.get(key, 0):>9} na sessão')
+        if len(lines) == 1:
+            lines.append('    (nenhum evento)')
+        return lines
+
+
+class PairMetric:
+    """
+    Pareia marcadores de início e fim pela chave (grupo `key` das regex)
+    match=first mede do primeiro início pendente; match=last mede do último
+    (ex.: debounce, onde cada tecla reinicia a espera)
+    """
+
+    def __init__(self, rule, window_slots, max_pending, timeout):
+        self.name = rule['name']
+        self.start = re.compile(rule['start'])
+        self.end = re.compile(rule['end'])
+        self.match_last = rule.get('match', 'first') == 'last'
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pending = OrderedDict()
+        self.unmatched = 0
+        self.expired = 0
+        self.session = LogHistogram()
+        self.window = Window(window_slots, LogHistogram)
+
+    def feed(self, text, ts):
+        # O fim é testado primeiro: a linha de commit do debounce também casa
+        # com a regex de início e não pode rearmar a espera
+        m = self.end.search(text)
+        if m:
+            key = m.groupdict().get('key') or ''
+            started = self.pending.pop(key, None)
+            if started is None and key:
+                # Início logado sem chave (ex.: _onTextChanged não loga o index)
+                started = self.pending.pop('', None)
+            if started is None and not key and self.pending:
+                # Fim sem chave fecha o início pendente mais antigo
+                _, started = self.pending.popitem(last=False)
+            if started is None:
+                self.unmatched += 1
+                return
+            elapsed_ms = max(0.0, (ts - started) * 1000)
+            self.session.add(elapsed_ms)
+            self.window.current.add(elapsed_ms)
+            return
+        m = self.start.search(text)
+        if m:
+            key = m.groupdict().get('key') or ''
+            if key in self.pending and not self.match_last:
+                return
+            self.pending.pop(key, None)
+            self.pending[key] = ts
+            while len(self.pending) > self.max_pending:
+                self.pending.popitem(last=False)
+                self.expired += 1
+
+    def expire(self, now):
+        while self.pending:
+            key, started = next(iter(self.pending.items()))
+            if now - started < self.timeout:
+                break
+            del self.pending[key]
+            self.expired += 1
+
+    def report(self, window_seconds, _top, regression=1.5):
+        window = self.window.merged()
+        lines = []
+        flag = ''
+        if window.total and self.session.total >= 20:
+            if window.percentile(95) > self.session.percentile(95) * regression:
+                flag = '  ⚠️  REGRESSÃO: p95 da janela acima do p95 da sessão'
+        lines.append(
+            f'⏱️  {self.name}: janela n={window.total} p50={format_ms(window.percentile(50))} '
+            f'p95={format_ms(window.percentile(95))} p99={format_ms(window.percentile(99))} | '
+            f'sessão n={self.session.total} p95={format_ms(self.session.percentile(95))} | '
+            f'pendentes={len(self.pending)} sem par={self.unmatched} expirados={self.expired}{flag}'
+        )
+        lines.extend(window.bars())
+        return lines
+
+
+def format_ms(value):
+    if value >= 60000:
+        return f'{value / 60000:.1f}min'
+    if value >= 1000:
+        return f'{value / 1000:.2f}s'
+    return f'{value:.1f}ms'
+
+
+class Analyzer:
+    def __init__(self, rules, interval, window_slots, max_keys, max_pending, timeout, top):
+        self.interval = interval
+        self.window_slots = window_slots
+        self.top = top
+        self.metrics = []
+        for rule in rules:
+            if rule['kind'] == 'counter':
+                self.metrics.append(CounterMetric(rule, window_slots, max_keys))
+            elif rule['kind'] == 'pair':
+                self.metrics.append(PairMetric(rule, window_slots, max_pending, timeout))
+            else:
+                raise ValueError(f"Tipo de regra desconhecido: {rule['kind']}")
+        self.lines = 0
+        self.timestamped = 0
+        self.last_ts = None
+        # Horários sem data: segundos desde a meia-noite do primeiro dia visto
+        self.day_offset = 0
+        self.next_rotation = None
+        self.elapsed_slots = 1
+
+    def feed(self, raw_line, arrival):
+        text = LOG_PREFIX_RE.sub('', raw_line.rstrip('\r\n'))
+        # Depois do primeiro timestamp, linhas sem horário herdam o último visto
+        ts = arrival if self.last_ts is None else self.last_ts
+        m = TIMESTAMP_RE.match(text)
+        if m:
+            parsed = parse_timestamp(m)
+            if parsed is not None and not m.group('date'):
+                parsed += self.day_offset
+                if self.last_ts is not None and parsed < self.last_ts - DAY_ROLLOVER:
+                    # Voltou mais de 12 h: virou o dia (sessão passando da meia-noite)
+                    self.day_offset += 86400
+                    parsed += 86400
+            if parsed is not None:
+                if self.last_ts is None:
+                    # Troca do relógio de chegada para o do log: recomeça o intervalo
+                    self.next_rotation = None
+                ts = self.last_ts = parsed
+                self.timestamped += 1
+                text = text[m.end():]
+        self.lines += 1
+        self.tick(ts)
+        for metric in self.metrics:
+            metric.feed(text, ts)
+
+    def idle(self, now):
+        """Sem linhas novas: só avança a janela se o relógio for o de chegada"""
+        if self.last_ts is None:
+            self.tick(now)
+
+    def tick(self, now):
+        """Avança a janela; imprime um relatório a cada intervalo"""
+        if self.next_rotation is None:
+            self.next_rotation = now + self.interval
+            return
+        if now < self.next_rotation:
+            return
+        # Intervalos sem linhas também contam: a janela anda com o relógio,
+        # mas um salto maior que a janela inteira não gera relatórios vazios
+        if now - self.next_rotation > self.interval * self.window_slots:
+            self.next_rotation = now - self.interval * self.window_slots
+        while now >= self.next_rotation:
+            self.print_report()
+            for metric in self.metrics:
+                metric.window.rotate()
+                if isinstance(metric, PairMetric):
+                    metric.expire(self.next_rotation)
+            self.elapsed_slots = min(self.elapsed_slots + 1, self.window_slots)
+            self.next_rotation += self.interval
+
+    def print_report(self, final=False):
+        stamp = datetime.now().strftime('%H:%M:%S')
+        title = 'RESUMO FINAL' if final else 'métricas'
+        print(f'\n===== {title} {stamp} | {self.lines} linhas =====')
+        window_seconds = self.elapsed_slots * self.interval
+        for metric in self.metrics:
+            for line in metric.report(window_seconds, self.top):
+                print(line)
+        sys.stdout.flush()
+
+
+def parse_timestamp(m):
+    """Converte o timestamp da linha em segundos (epoch, ou segundos do dia sem data)"""
+    clock = m.group('time').replace(',', '.')
+    try:
+        if m.group('date'):
+            return datetime.fromisoformat(f"{m.group('date')} {clock}").timestamp()
+        h, mi, s = clock.split(':')
+        return int(h) * 3600 + int(mi) * 60 + float(s)
+    except ValueError:
+        return None
+
+
+def follow(path, from_start, poll=0.2):
+    """Gera linhas de um arquivo como `tail -F` (aguenta truncamento e rotação)"""
+    handle = open(path, 'r', encoding='utf-8', errors='replace')
+    if not from_start:
+        handle.seek(0, os.SEEK_END)
+    inode = os.fstat(handle.fileno()).st_ino
+    partial = ''
+    while True:
+        chunk = handle.readline()
+        if chunk:
+            partial += chunk
+            if partial.endswith('\n'):
+                yield partial
+                partial = ''
+            continue
+        yield None  # ocioso: permite avançar a janela
+        time.sleep(poll)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        if stat.st_ino != inode:
+            handle.close()
+            handle = open(path, 'r', encoding='utf-8', errors='replace')
+            inode = os.fstat(handle.fileno()).st_ino
+        elif stat.st_size < handle.tell():
+            handle.seek(0)
+
+
+def load_rules(paths, defaults=True):
+    rules = list(DEFAULT_RULES) if defaults else []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            extra = json.load(f)
+        by_name = {r['name']: i for i, r in enumerate(rules)}
+        for rule in extra:
+            if rule['name'] in by_name:
+                rules[by_name[rule['name']]] = rule
+            else:
+                rules.append(rule)
+    return rules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Métricas de latência a partir dos logs do app')
+    parser.add_argument('inputs', nargs='*', default=['-'], help="arquivos de log ou '-' para stdin")
+    parser.add_argument('-f', '--follow', action='store_true', help='acompanha o arquivo como tail -F')
+    parser.add_argument('--from-start', action='store_true', help='com --follow, lê o arquivo desde o início')
+    parser.add_argument('--interval', type=float, default=10.0, help='segundos entre relatórios')
+    parser.add_argument('--window', type=int, default=6, help='intervalos na janela deslizante')
+    parser.add_argument('--top', type=int, default=10, help='widgets exibidos por contador')
+    parser.add_argument('--max-keys', type=int, default=500, help='chaves distintas por contador')
+    parser.add_argument('--max-pending', type=int, default=1000, help='inícios pendentes por par')
+    parser.add_argument('--timeout', type=float, default=600.0, help='segundos até descartar um início sem fim')
+    parser.add_argument('--rules', action='append', default=[], help='arquivo JSON com regras extras')
+    parser.add_argument('--no-default-rules', action='store_true')
+    args = parser.parse_args(argv)
+
+    if args.follow and (len(args.inputs) != 1 or args.inputs[0] == '-'):
+        parser.error('--follow requer exatamente um arquivo')
+
+    analyzer = Analyzer(
+        load_rules(args.rules, not args.no_default_rules),
+        args.interval, args.window, args.max_keys, args.max_pending, args.timeout, args.top,
+    )
+
+    try:
+        if args.follow:
+            for line in follow(args.inputs[0], args.from_start):
+                if line is None:
+                    analyzer.idle(time.time())
+                else:
+                    analyzer.feed(line, time.time())
+        else:
+            for path in args.inputs:
+                stream = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8', errors='replace')
+                with stream:
+                    for line in stream:
+                        analyzer.feed(line, time.time())
+    except KeyboardInterrupt:
+        pass
+
+    analyzer.print_report(final=True)
+    live = args.follow or '-' in args.inputs
+    if not live and analyzer.lines and not analyzer.timestamped:
+        print('\n⚠️  Arquivo sem timestamps: latências usam o horário de leitura e não são confiáveis.'
+              '\n   Capture com timestamps (ex: flutter run 2>&1 | ts "%H:%M:%.S" > sessao.log)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
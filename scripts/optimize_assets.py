@@ -0,0 +1,629 @@
+#!/usr/bin/env python3
+"""
+Otimização sem perdas das imagens do app e do payload do instalador
+
+Os PNGs de assets/images/, o app_icon.ico gerado por create_windows_icon.py e
+tudo o que o installer/setup.iss empacota vão para o usuário exatamente como
+foram exportados. Este estágio, sem dependências externas (só zlib):
+
+    - recomprime PNGs: remove filtros e escolhe por linha o melhor filtro
+      (heurística da libpng), tenta variações do zlib e fica com o menor
+    - reduz o tipo de cor quando não perde nada (RGBA opaco -> RGB, cinza -> G)
+    - remove metadados (tEXt, zTXt, iTXt, tIME, eXIf, pHYs); chunks que mudam a
+      cor exibida (sRGB, gAMA, cHRM, iCCP) são mantidos
+    - guarda entradas grandes de .ico (256px) como PNG em vez de BMP e
+      otimiza as que já são PNG; remove entradas repetidas
+    - deduplica: conteúdo idêntico é processado uma vez e imagens com os
+      mesmos pixels são listadas no relatório
+
+Todo resultado é decodificado de volta e comparado pixel a pixel com o
+original antes de ser aceito. Arquivos são processados em paralelo e gravados
+pelo pipeline de codemods (dry-run sem --apply, snapshot antes de gravar).
+
+Uso:
+    python scripts/optimize_assets.py                  # assets, ícone e instalador
+    python scripts/optimize_assets.py --apply
+    python scripts/optimize_assets.py assets/images/app_logo.png --fast
+    python scripts/optimize_assets.py --json build/assets-report.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from codemod import REPO_ROOT, Codemod
+from snapshot_store import format_size
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Metadados que não afetam a imagem exibida
+METADATA_CHUNKS = {b'tEXt', b'zTXt', b'iTXt', b'tIME', b'eXIf', b'pHYs', b'dSIG'}
+# Chunks cujo formato depende do tipo de cor: com eles não há redução de cor
+COLOR_BOUND_CHUNKS = {b'tRNS', b'sBIT', b'bKGD', b'hIST', b'sPLT'}
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+IMAGE_SUFFIXES = {'.png', '.ico'}
+# Entradas de .ico a partir deste tamanho viram PNG (o Windows aceita desde o Vista)
+ICO_PNG_MIN = 256
+INSTALLER_SCRIPT = 'installer/setup.iss'
+WINDOWS_ICON = 'windows/runner/resources/app_icon.ico'
+
+
+class AssetError(Exception):
+    pass
+
+
+# ============================================================================
+# PNG
+# ============================================================================
+
+def read_chunks(data):
+    """[(tipo, corpo)] de um PNG, validando assinatura e CRC"""
+    if not data.startswith(PNG_SIGNATURE):
+        raise AssetError('Não é um PNG')
+    chunks, i = [], len(PNG_SIGNATURE)
+    while i < len(data):
+        if i + 8 > len(data):
+            raise AssetError('PNG truncado')
+        length, kind = struct.unpack('>I4s', data[i:i + 8])
+        body = data[i + 8:i + 8 + length]
+        crc, = struct.unpack('>I', data[i + 8 + length:i + 12 + length])
+        if zlib.crc32(kind + body) != crc:
+            raise AssetError(f'CRC inválido no chunk {kind.decode("latin-1")}')
+        chunks.append((kind, body))
+        i += 12 + length
+        if kind == b'IEND':
+            break
+    return chunks
+
+
+def write_png(chunks):
+    out = [PNG_SIGNATURE]
+    for kind, body in chunks:
+        out.append(struct.pack('>I4s', len(body), kind))
+        out.append(body)
+        out.append(struct.pack('>I', zlib.crc32(kind + body)))
+    return b''.join(out)
+
+
+def parse_ihdr(body):
+    width, height, depth, ctype, _, _, interlace = struct.unpack('>IIBBBBB', body)
+    if ctype not in CHANNELS:
+        raise AssetError(f'Tipo de cor desconhecido: {ctype}')
+    bits = depth * CHANNELS[ctype]
+    return {
+        'width': width, 'height': height, 'depth': depth, 'ctype': ctype,
+        'interlace': interlace,
+        'bpp': max(1, bits // 8),  # distância do "pixel à esquerda" nos filtros
+        'stride': (width * bits + 7) // 8,
+    }
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def unfilter(stream, height, stride, bpp):
+    """Remove os filtros PNG: devolve as linhas cruas (sem o byte de filtro)"""
+    rows, prev = [], bytes(stride)
+    pos = 0
+    for _ in range(height):
+        kind = stream[pos]
+        line = bytearray(stream[pos + 1:pos + 1 + stride])
+        pos += 1 + stride
+        if kind == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 255
+        elif kind == 2:
+            line = bytearray((x + u) & 255 for x, u in zip(line, prev))
+        elif kind == 3:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + prev[i]) >> 1)) & 255
+        elif kind == 4:
+            for i in range(stride):
+                if i >= bpp:
+                    line[i] = (line[i] + _paeth(line[i - bpp], prev[i], prev[i - bpp])) & 255
+                else:
+                    line[i] = (line[i] + prev[i]) & 255
+        elif kind != 0:
+            raise AssetError(f'Filtro PNG inválido: {kind}')
+        prev = bytes(line)
+        rows.append(prev)
+    return rows
+
+
+def filter_candidates(rows, bpp):
+    """
+    Cada linha filtrada com os 5 filtros. Devolve os streams "todas as linhas
+    com o filtro k" e o adaptativo (menor soma de diferenças absolutas por
+    linha, a heurística da libpng)
+    """
+    streams = [bytearray() for _ in range(5)]
+    adaptive = bytearray()
+    prev = None
+    for row in rows:
+        up = prev if prev is not None else bytes(len(row))
+        left = bytes(bpp) + row[:-bpp]
+        up_left = bytes(bpp) + up[:-bpp]
+        options = (
+            row,
+            bytes((x - l) & 255 for x, l in zip(row, left)),
+            bytes((x - u) & 255 for x, u in zip(row, up)),
+            bytes((x - ((l + u) >> 1)) & 255 for x, l, u in zip(row, left, up)),
+            bytes((x - _paeth(l, u, c)) & 255 for x, l, u, c in zip(row, left, up, up_left)),
+        )
+        best, best_cost = 0, None
+        for kind, filtered in enumerate(options):
+            streams[kind].append(kind)
+            streams[kind] += filtered
+            cost = sum(v if v < 128 else 256 - v for v in filtered)
+            if best_cost is None or cost < best_cost:
+                best, best_cost = kind, cost
+        adaptive.append(best)
+        adaptive += options[best]
+        prev = row
+    return [bytes(s) for s in streams] + [bytes(adaptive)]
+
+
+def compress(streams, finalists=2):
+    """
+    Menor zlib entre os streams candidatos. Uma passada rápida (nível 6)
+    escolhe os finalistas; só eles passam pelas variações lentas do nível 9
+    """
+    ranked = sorted(streams, key=lambda s: len(zlib.compress(s, 6)))
+    best = None
+    for stream in ranked[:finalists]:
+        for strategy in (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED):
+            c = zlib.compressobj(9, zlib.DEFLATED, 15, 9 if len(stream) < 1 << 16 else 8, strategy)
+            packed = c.compress(stream) + c.flush()
+            if best is None or len(packed) < len(best):
+                best = packed
+    return best
+
+
+def reduce_color(ctype, rows, chunk_kinds):
+    """Reduz o tipo de cor (só 8 bits) quando nenhum pixel muda"""
+    if ctype not in (2, 4, 6) or chunk_kinds & COLOR_BOUND_CHUNKS:
+        return ctype, rows
+    channels = CHANNELS[ctype]
+    if ctype in (4, 6) and all(row[channels - 1::channels] == b'\xff' * (len(row) // channels) for row in rows):
+        # alfa sempre 255: descarta o canal
+        rows = [_drop_channel(row, channels) for row in rows]
+        ctype, channels = (0 if ctype == 4 else 2), channels - 1
+    if ctype in (2, 6) and b'iCCP' not in chunk_kinds and all(
+        row[0::channels] == row[1::channels] == row[2::channels] for row in rows
+    ):
+        # R == G == B em todos os pixels: cinza (mais alfa, se houver)
+        keep = (0, 3) if ctype == 6 else (0,)
+        rows = [_pick_channels(row, channels, keep) for row in rows]
+        ctype = 4 if ctype == 6 else 0
+    return ctype, rows
+
+
+def _drop_channel(row, channels):
+    return _pick_channels(row, channels, range(channels - 1))
+
+
+def _pick_channels(row, channels, keep):
+    keep = list(keep)
+    out = bytearray(len(row) // channels * len(keep))
+    for i, c in enumerate(keep):
+        out[i::len(keep)] = row[c::channels]
+    return bytes(out)
+
+
+def to_rgba(ctype, rows):
+    """Linhas RGBA 8 bits, para comparar imagens de tipos de cor diferentes"""
+    channels = CHANNELS[ctype]
+    result = []
+    for row in rows:
+        pixels = len(row) // channels
+        out = bytearray(b'\xff' * (pixels * 4))
+        if ctype in (0, 4):
+            for c in range(3):
+                out[c::4] = row[0::channels]
+            if ctype == 4:
+                out[3::4] = row[1::2]
+        else:
+            for c in range(channels):
+                out[c::4] = row[c::channels]
+        result.append(bytes(out))
+    return result
+
+
+def decode(data):
+    """(ihdr, chunks, linhas cruas ou None se entrelaçado)"""
+    chunks = read_chunks(data)
+    if not chunks or chunks[0][0] != b'IHDR':
+        raise AssetError('PNG sem IHDR')
+    ihdr = parse_ihdr(chunks[0][1])
+    stream = zlib.decompress(b''.join(body for kind, body in chunks if kind == b'IDAT'))
+    if ihdr['interlace']:
+        return ihdr, chunks, stream, None
+    rows = unfilter(stream, ihdr['height'], ihdr['stride'], ihdr['bpp'])
+    return ihdr, chunks, stream, rows
+
+
+def pixel_key(ihdr, rows):
+    """Identidade visual da imagem (para deduplicação)"""
+    if rows is None:
+        return None
+    if ihdr['depth'] == 8 and ihdr['ctype'] != 3:
+        rows = to_rgba(ihdr['ctype'], rows)
+        tag = b'rgba8'
+    else:
+        tag = f'{ihdr["ctype"]}/{ihdr["depth"]}'.encode()
+    h = hashlib.sha256(tag + struct.pack('>II', ihdr['width'], ihdr['height']))
+    for row in rows:
+        h.update(row)
+    return h.hexdigest()
+
+
+def same_pixels(ihdr, rows, stream, candidate):
+    """Confere se o PNG candidato decodifica para os mesmos pixels do original"""
+    new_ihdr, _, new_stream, new_rows = decode(candidate)
+    if (ihdr['width'], ihdr['height']) != (new_ihdr['width'], new_ihdr['height']):
+        return False
+    if rows is None or new_rows is None:
+        return stream == new_stream
+    if ihdr['depth'] == new_ihdr['depth'] == 8 and 3 not in (ihdr['ctype'], new_ihdr['ctype']):
+        return to_rgba(ihdr['ctype'], rows) == to_rgba(new_ihdr['ctype'], new_rows)
+    return (ihdr['ctype'], ihdr['depth'], rows) == (new_ihdr['ctype'], new_ihdr['depth'], new_rows)
+
+
+def encode_png(ihdr, chunks, rows, stream, refilter=True):
+    """Monta o menor PNG possível para as mesmas linhas"""
+    kinds = {kind for kind, _ in chunks}
+    ctype = ihdr['ctype']
+    candidates = [stream]
+    if rows is not None and refilter:
+        if ihdr['depth'] == 8:
+            ctype, rows = reduce_color(ctype, rows, kinds)
+        bpp = max(1, ihdr['depth'] * CHANNELS[ctype] // 8)
+        candidates = filter_candidates(rows, bpp)
+        if stream and ctype == ihdr['ctype']:
+            candidates.append(stream)
+    idat = compress(candidates)
+    original = b''.join(body for kind, body in chunks if kind == b'IDAT')
+    if original and ctype == ihdr['ctype'] and len(original) <= len(idat):
+        idat = original  # o compressor original já era melhor: só tira os metadados
+    header = struct.pack('>IIBBBBB', ihdr['width'], ihdr['height'], ihdr['depth'],
+                         ctype, 0, 0, ihdr['interlace'])
+    out, placed = [(b'IHDR', header)], False
+    for kind, body in chunks[1:]:
+        if kind in METADATA_CHUNKS or kind == b'IEND':
+            continue
+        if kind == b'IDAT':
+            if not placed:
+                out.append((b'IDAT', idat))
+                placed = True
+            continue
+        out.append((kind, body))
+    out.append((b'IEND', b''))
+    return write_png(out)
+
+
+def optimize_png(data, refilter=True):
+    """
+    (PNG otimizado ou o original se não houver ganho, chave dos pixels).
+    Sempre sem perdas: o resultado é decodificado e conferido
+    """
+    ihdr, chunks, stream, rows = decode(data)
+    key = pixel_key(ihdr, rows)
+    candidate = encode_png(ihdr, chunks, rows, stream, refilter)
+    if len(candidate) < len(data) and same_pixels(ihdr, rows, stream, candidate):
+        return candidate, key
+    return data, key
+
+
+# ============================================================================
+# ICO
+# ============================================================================
+
+ICO_HEADER = struct.Struct('<HHH')
+ICO_ENTRY = struct.Struct('<BBBBHHII')
+
+
+def read_ico(data):
+    reserved, kind, count = ICO_HEADER.unpack_from(data)
+    if reserved != 0 or kind != 1:
+        raise AssetError('Não é um .ico')
+    entries = []
+    for n in range(count):
+        w, h, colors, _, planes, bpp, size, offset = ICO_ENTRY.unpack_from(data, 6 + 16 * n)
+        entries.append({
+            'width': w or 256, 'height': h or 256, 'colors': colors,
+            'planes': planes, 'bpp': bpp, 'data': data[offset:offset + size],
+        })
+    return entries
+
+
+def write_ico(entries):
+    header = [ICO_HEADER.pack(0, 1, len(entries))]
+    offset = 6 + 16 * len(entries)
+    for e in entries:
+        header.append(ICO_ENTRY.pack(e['width'] % 256, e['height'] % 256, e['colors'], 0,
+                                     e['planes'], e['bpp'], len(e['data']), offset))
+        offset += len(e['data'])
+    return b''.join(header + [e['data'] for e in entries])
+
+
+def dib_to_png(dib):
+    """Entrada BMP 32 bits de .ico como PNG RGBA (None se não suportado)"""
+    size, width, height, _, bpp, compression = struct.unpack_from('<IiiHHI', dib)
+    height //= 2  # o DIB do .ico inclui a máscara AND na altura
+    if bpp != 32 or compression != 0 or width <= 0 or height <= 0:
+        return None
+    stride = width * 4
+    pixels = dib[size:size + stride * height]
+    if len(pixels) < stride * height:
+        return None
+    rows = []
+    for y in range(height - 1, -1, -1):  # DIB é de baixo para cima
+        bgra = pixels[y * stride:(y + 1) * stride]
+        rgba = bytearray(stride)
+        rgba[0::4], rgba[1::4], rgba[2::4], rgba[3::4] = bgra[2::4], bgra[1::4], bgra[0::4], bgra[3::4]
+        rows.append(rgba)
+    if not any(any(row[3::4]) for row in rows):
+        # alfa todo zero: o Windows usa a máscara AND (1 bit, linhas de 4 bytes)
+        mask_stride = ((width + 31) // 32) * 4
+        mask = dib[size + stride * height:]
+        for y, row in enumerate(rows):
+            line = mask[(height - 1 - y) * mask_stride:]
+            for x in range(width):
+                row[x * 4 + 3] = 0 if line[x // 8] & (0x80 >> (x % 8)) else 255
+    rows = [bytes(row) for row in rows]
+    ihdr = {'width': width, 'height': height, 'depth': 8, 'ctype': 6, 'interlace': 0}
+    png = encode_png(ihdr, [(b'IHDR', b''), (b'IDAT', b'')], rows, None)
+    # mesma garantia do optimize_png: o PNG tem que decodificar para os pixels
+    # do DIB (com a máscara AND já aplicada ao alfa)
+    return png if same_pixels(ihdr, rows, None, png) else None
+
+
+def optimize_ico(data, refilter=True, png_min=ICO_PNG_MIN):
+    entries, seen, kept, notes = read_ico(data), set(), [], []
+    for e in entries:
+        key = (e['width'], e['height'], e['bpp'], hashlib.sha256(e['data']).digest())
+        if key in seen:
+            notes.append(f'entrada {e["width"]}x{e["height"]} repetida removida')
+            continue
+        seen.add(key)
+        if e['data'].startswith(PNG_SIGNATURE):
+            e['data'], _ = optimize_png(e['data'], refilter)
+        elif e['width'] >= png_min:
+            png = dib_to_png(e['data'])
+            if png is not None and len(png) < len(e['data']):
+                e['data'] = png
+                notes.append(f'entrada {e["width"]}x{e["height"]} BMP -> PNG')
+        kept.append(e)
+    result = write_ico(kept)
+    return (result, notes) if len(result) < len(data) else (data, [])
+
+
+# ============================================================================
+# Execução em paralelo
+# ============================================================================
+
+def optimize_bytes(data, suffix, refilter=True):
+    """(novo conteúdo, observações, chaves de pixels) de um PNG ou ICO"""
+    if suffix == '.png':
+        new, key = optimize_png(data, refilter)
+        return new, [], [key]
+    new, notes = optimize_ico(data, refilter)
+    keys = []
+    for e in read_ico(new):
+        if e['data'].startswith(PNG_SIGNATURE):
+            ihdr, _, _, rows = decode(e['data'])
+            keys.append(pixel_key(ihdr, rows))
+    return new, notes, keys
+
+
+def _worker(job):
+    digest, suffix, data, refilter = job
+    try:
+        new, notes, keys = optimize_bytes(data, suffix, refilter)
+        return digest, new, notes, keys, None
+    except (AssetError, zlib.error, struct.error, ValueError, IndexError) as e:
+        return digest, data, [], [], str(e)
+
+
+def optimize_files(paths, jobs=None, refilter=True):
+    """
+    Otimiza os arquivos em paralelo. Conteúdos idênticos (mesmo sha256) são
+    processados uma vez só. Devolve [{file, before, after, data, notes, keys, error}]
+    """
+    contents = {}
+    for path in paths:
+        data = (REPO_ROOT / path).read_bytes()
+        contents[path] = (hashlib.sha256(data).hexdigest(), data)
+    work = {}
+    for path, (digest, data) in contents.items():
+        work.setdefault(digest, (digest, Path(path).suffix.lower(), data, refilter))
+    jobs = jobs or min(len(work), os.cpu_count() or 1) or 1
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            done = {r[0]: r for r in pool.map(_worker, work.values())}
+    else:
+        done = {r[0]: r for r in map(_worker, work.values())}
+    results = []
+    for path, (digest, data) in contents.items():
+        _, new, notes, keys, error = done[digest]
+        results.append({
+            'file': path, 'before': len(data), 'after': len(new), 'data': new,
+            'notes': notes, 'keys': keys, 'error': error, 'sha256': digest,
+        })
+    return results
+
+
+# ============================================================================
+# Alvos: assets do pubspec, ícone do Windows e payload do instalador
+# ============================================================================
+
+def pubspec_assets(root=REPO_ROOT):
+    """Imagens declaradas em flutter: assets: do pubspec.yaml"""
+    text = (root / 'pubspec.yaml').read_text(encoding='utf-8')
+    m = re.search(r'^  assets:\n((?:    - .+\n)+)', text, re.MULTILINE)
+    files = []
+    for entry in re.findall(r'^    - (.+)$', m.group(1) if m else '', re.MULTILINE):
+        target = root / entry.strip()
+        candidates = sorted(target.iterdir()) if target.is_dir() else [target]
+        files += [p for p in candidates if p.is_file() and p.suffix.lower() in IMAGE_SUFFIXES]
+    return [p.relative_to(root).as_posix() for p in files]
+
+
+def installer_payload(root=REPO_ROOT, script=INSTALLER_SCRIPT):
+    """
+    Arquivos empacotados pelo setup.iss: entradas Source: de [Files] (com os
+    #define expandidos) e o SetupIconFile. Devolve (arquivos, fontes ausentes)
+    """
+    iss = root / script
+    text = iss.read_text(encoding='utf-8', errors='replace')
+    defines = dict(re.findall(r'^#define\s+(\w+)\s+"([^"]*)"', text, re.MULTILINE))
+
+    def expand(value):
+        value = re.sub(r'\{#(\w+)\}', lambda m: defines.get(m.group(1), m.group(0)), value)
+        return value.replace('\\', '/')
+
+    files, missing = [], []
+    icon = re.search(r'^SetupIconFile=(.+)$', text, re.MULTILINE)
+    sources = [(icon.group(1).strip(), '')] if icon else []
+    section = re.search(r'^\[Files\]\n(.*?)(?=^\[)', text, re.MULTILINE | re.DOTALL)
+    for line in (section.group(1) if section else '').splitlines():
+        m = re.match(r'\s*Source:\s*"([^"]+)"(.*)', line)
+        if m:
+            sources.append((m.group(1), m.group(2)))
+    for source, options in sources:
+        pattern = (iss.parent / expand(source)).resolve()
+        if '*' in pattern.name or '?' in pattern.name:
+            recursive = 'recursesubdirs' in options
+            found = [p for p in (pattern.parent.rglob(pattern.name) if recursive
+                                 else pattern.parent.glob(pattern.name)) if p.is_file()]
+        else:
+            found = [pattern] if pattern.is_file() else []
+        if not found:
+            missing.append(expand(source))
+        for p in found:
+            try:
+                rel = p.relative_to(root).as_posix()
+            except ValueError:
+                continue
+            if rel not in files:
+                files.append(rel)
+    return files, missing
+
+
+# ============================================================================
+# Relatório
+# ============================================================================
+
+def print_results(results):
+    print(f'\n🖼️  {len(results)} imagem(ns)')
+    print(f'   {"antes":>10} {"depois":>10} {"economia":>10}')
+    for r in sorted(results, key=lambda r: r['after'] - r['before']):
+        saved = r['before'] - r['after']
+        pct = f'{100 * saved / r["before"]:.0f}%' if r['before'] else '-'
+        print(f'   {format_size(r["before"]):>10} {format_size(r["after"]):>10} '
+              f'{format_size(saved):>10} {pct:>4}  {r["file"]}')
+        for note in r['notes']:
+            print(f'      ↳ {note}')
+        if r['error']:
+            print(f'      ⚠️  ignorado: {r["error"]}')
+
+
+def duplicate_groups(results):
+    """Arquivos com os mesmos bytes e imagens com os mesmos pixels"""
+    by_bytes, by_pixels = {}, {}
+    for r in results:
+        by_bytes.setdefault(r['sha256'], []).append(r['file'])
+        for key in r['keys']:
+            if key:
+                by_pixels.setdefault(key, set()).add(r['file'])
+    same_bytes = [files for files in by_bytes.values() if len(files) > 1]
+    same_pixels = [sorted(files) for files in by_pixels.values() if len(files) > 1]
+    return same_bytes, [g for g in same_pixels if g not in same_bytes]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Otimização sem perdas de PNG/ICO e do payload do instalador')
+    parser.add_argument('files', nargs='*', help='PNG/ICO (padrão: assets do pubspec, ícone e instalador)')
+    parser.add_argument('--no-installer', action='store_true', help='não inclui o payload do setup.iss')
+    parser.add_argument('--fast', action='store_true', help='só remove metadados e recomprime (sem refiltrar)')
+    parser.add_argument('-j', '--jobs', type=int, help='processos em paralelo (padrão: nº de CPUs)')
+    parser.add_argument('--json', help='salva o relatório em JSON')
+    parser.add_argument('--apply', action='store_true', help='grava os arquivos otimizados')
+    args = parser.parse_args(argv)
+
+    payload, missing = ([], [])
+    if args.files:
+        targets = []
+        for f in args.files:
+            path = Path(f).resolve()
+            try:
+                targets.append(path.relative_to(REPO_ROOT).as_posix())
+            except ValueError:
+                print(f'❌ Fora do projeto: {path}')
+                return 1
+    else:
+        targets = pubspec_assets() + [WINDOWS_ICON]
+        if not args.no_installer:
+            payload, missing = installer_payload()
+            targets += [f for f in payload if Path(f).suffix.lower() in IMAGE_SUFFIXES]
+    targets = list(dict.fromkeys(t for t in targets if (REPO_ROOT / t).is_file()))
+    if not targets:
+        print('❌ Nenhuma imagem encontrada')
+        return 1
+
+    results = optimize_files(targets, args.jobs, refilter=not args.fast)
+    print_results(results)
+    before = sum(r['before'] for r in results)
+    saved = sum(r['before'] - r['after'] for r in results)
+    print(f'\n✨ Total: {format_size(before)} -> {format_size(before - saved)} ({format_size(saved)} economizados)')
+
+    same_bytes, same_pixels = duplicate_groups(results)
+    for files in same_bytes:
+        print(f'   🔁 Arquivos idênticos (otimizados uma vez): {", ".join(files)}')
+    for files in same_pixels:
+        print(f'   🔁 Mesmos pixels em arquivos diferentes: {", ".join(files)}')
+
+    installer = None
+    if payload or missing:
+        by_file = {r['file']: r for r in results}
+        total = sum((REPO_ROOT / f).stat().st_size for f in payload)
+        payload_saved = sum(by_file[f]['before'] - by_file[f]['after'] for f in payload if f in by_file)
+        installer = {'files': len(payload), 'before': total, 'after': total - payload_saved, 'missing': missing}
+        print(f'\n📦 Instalador ({INSTALLER_SCRIPT}): {len(payload)} arquivo(s), '
+              f'{format_size(total)} -> {format_size(total - payload_saved)} '
+              f'({format_size(payload_saved)} economizados antes da compressão do Inno Setup)')
+        for source in missing:
+            print(f'   ⚠️  Não encontrado: {source} (rode flutter build windows --release)')
+
+    if args.json:
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(json.dumps({
+            'assets': [{k: r[k] for k in ('file', 'before', 'after', 'notes', 'error')} for r in results],
+            'duplicates': {'bytes': same_bytes, 'pixels': same_pixels},
+            'installer': installer,
+        }, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f'\n📝 Relatório: {out}')
+
+    run = Codemod('optimize-assets', apply=args.apply)
+    for r in results:
+        if r['after'] < r['before']:
+            run.write(r['file'], r['data'])
+    run.commit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Snapshots deduplicados dos arquivos tocados por codemods e migrações
+
+Antes de gravar, cada execução registra o estado anterior apenas dos arquivos
+que vai tocar. O conteúdo é guardado por hash (sha256) e comprimido com zlib,
+então um arquivo que não mudou entre execuções é armazenado uma única vez:
+um snapshot típico custa alguns KB, não uma cópia da árvore.
+
+Estrutura em backups/snapshots/ (ignorada pelo git):
+    objects/ab/cdef...   conteúdo comprimido, nome = sha256 dos bytes originais
+    runs/<id>.json       manifesto da execução: {arquivo: sha256 ou null}
+                         (null = o arquivo não existia; restaurar o remove)
+
+A restauração também tira um snapshot do estado atual antes de gravar, então
+pode ser desfeita da mesma forma.
+
+Uso:
+    python scripts/snapshot_store.py list
+    python scripts/snapshot_store.py show 20251105-142310-dart-reachability
+    python scripts/snapshot_store.py restore 20251105-142310-dart-reachability           # dry-run
+    python scripts/snapshot_store.py restore 20251105-142310-dart-reachability --apply
+    python scripts/snapshot_store.py restore last --apply   # desfaz a última execução
+    python scripts/snapshot_store.py prune --keep 20
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import zlib
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STORE_DIR = Path('backups') / 'snapshots'
+COMPRESS_LEVEL = 9
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _atomic_write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class SnapshotStore:
+    """Objetos endereçados por conteúdo + manifestos por execução"""
+
+    def __init__(self, root=REPO_ROOT, store=None):
+        self.root = Path(root).resolve()
+        self.store = Path(store) if store else self.root / STORE_DIR
+        self.objects = self.store / 'objects'
+        self.runs_dir = self.store / 'runs'
+
+    # ------------------------------------------------------------------ objetos
+
+    def _object_path(self, digest):
+        return self.objects / digest[:2] / digest[2:]
+
+    def put(self, data):
+        """Guarda bytes e devolve (sha256, bytes novos gravados no store)"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, 0
+        packed = zlib.compress(data, COMPRESS_LEVEL)
+        _atomic_write(path, packed)
+        return digest, len(packed)
+
+    def get(self, digest):
+        path = self._object_path(digest)
+        if not path.exists():
+            raise SnapshotError(f'Objeto ausente no store: {digest}')
+        data = zlib.decompress(path.read_bytes())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise SnapshotError(f'Objeto corrompido: {digest}')
+        return data
+
+    # ---------------------------------------------------------------- execuções
+
+    def _rel(self, path):
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.root / path
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            raise SnapshotError(f'Fora do projeto: {path}')
+
+    def _new_id(self, name):
+        slug = re.sub(r'[^A-Za-z0-9_.-]+', '-', name).strip('-') or 'run'
+        base = f'{time.strftime("%Y%m%d-%H%M%S")}-{slug}'
+        run_id, n = base, 1
+        while (self.runs_dir / f'{run_id}.json').exists():
+            n += 1
+            run_id = f'{base}-{n}'
+        return run_id
+
+    def snapshot(self, name, paths):
+        """
+        Registra o estado atual dos arquivos informados (relativos à raiz ou
+        absolutos) e devolve o manifesto. Arquivos inexistentes entram como null
+        """
+        files, stored = {}, 0
+        for path in paths:
+            rel = self._rel(path)
+            target = self.root / rel
+            if target.is_file():
+                digest, written = self.put(target.read_bytes())
+                files[rel] = digest
+                stored += written
+            else:
+                files[rel] = None
+        manifest = {
+            'id': self._new_id(name),
+            'name': name,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'seq': time.time_ns(),
+            'files': dict(sorted(files.items())),
+            'stored_bytes': stored,
+        }
+        _atomic_write(self.runs_dir / f'{manifest["id"]}.json',
+                      json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8'))
+        return manifest
+
+    def runs(self):
+        """
+        Manifestos do mais antigo para o mais recente. A ordem vem de seq (ns):
+        created tem resolução de segundos e empata com um restore logo depois
+        """
+        if not self.runs_dir.exists():
+            return []
+        manifests = [json.loads(p.read_text(encoding='utf-8')) for p in self.runs_dir.glob('*.json')]
+        return sorted(manifests, key=lambda m: m['seq'])
+
+    def load(self, run_id):
+        if run_id == 'last':
+            runs = self.runs()
+            if not runs:
+                raise SnapshotError('Nenhuma execução registrada')
+            return runs[-1]
+        path = self.runs_dir / f'{run_id}.json'
+        if not path.exists():
+            # aceita prefixo único (ex.: só a data/hora)
+            matches = [m for m in self.runs() if m['id'].startswith(run_id)]
+            if len(matches) != 1:
+                raise SnapshotError(f'Execução não encontrada ou ambígua: {run_id}')
+            return matches[0]
+        return json.loads(path.read_text(encoding='utf-8'))
+
+    def diff(self, manifest):
+        """[(arquivo, ação)] necessárias para voltar ao estado do manifesto"""
+        actions = []
+        for rel, digest in manifest['files'].items():
+            target = self.root / rel
+            exists = target.is_file()
+            if digest is None:
+                if exists:
+                    actions.append((rel, 'remove'))
+            elif not exists:
+                actions.append((rel, 'cria'))
+            elif hashlib.sha256(target.read_bytes()).hexdigest() != digest:
+                actions.append((rel, 'altera'))
+        return actions
+
+    def restore(self, run_id):
+        """Volta os arquivos da execução ao estado anterior a ela"""
+        manifest = self.load(run_id)
+        actions = self.diff(manifest)
+        if not actions:
+            return None, actions
+        # lê todos os objetos antes de tocar no disco: falha sem efeito parcial
+        contents = {rel: self.get(manifest['files'][rel]) for rel, action in actions if action != 'remove'}
+        undo = self.snapshot(f'restore-{manifest["id"]}', [rel for rel, _ in actions])
+        for rel, action in actions:
+            target = self.root / rel
+            if action == 'remove':
+                target.unlink()
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(contents[rel])
+        return undo, actions
+
+    def prune(self, keep):
+        """Mantém as últimas keep execuções e apaga objetos sem referência"""
+        runs = self.runs()
+        removed = runs[:-keep] if keep else runs
+        for manifest in removed:
+            (self.runs_dir / f'{manifest["id"]}.json').unlink()
+        live = {d for m in runs[len(removed):] for d in m['files'].values() if d}
+        freed = 0
+        if self.objects.exists():
+            for path in self.objects.glob('*/*'):
+                if path.parent.name + path.name not in live:
+                    freed += path.stat().st_size
+                    path.unlink()
+        return len(removed), freed
+
+    def size(self):
+        if not self.objects.exists():
+            return 0, 0
+        sizes = [p.stat().st_size for p in self.objects.glob('*/*')]
+        return len(sizes), sum(sizes)
+
+
+def snapshot_files(name, paths, root=REPO_ROOT):
+    """
+    Atalho para scripts que gravam arquivos diretamente (migrações antigas):
+    chame antes de sobrescrever. Caminhos relativos são resolvidos a partir do
+    diretório atual, como no open() dos próprios scripts
+    """
+    manifest = SnapshotStore(root).snapshot(name, [Path(p).resolve() for p in paths])
+    print(f'📸 Snapshot {manifest["id"]} ({format_size(manifest["stored_bytes"])} novos)')
+    return manifest
+
+
+def format_size(n):
+    for unit in ('B', 'KB', 'MB'):
+        if n < 1024 or unit == 'MB':
+            return f'{n:.0f} {unit}' if unit == 'B' else f'{n:.1f} {unit}'
+        n /= 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Snapshots dos arquivos tocados por codemods')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('list', help='lista as execuções')
+    show = sub.add_parser('show', help='arquivos de uma execução')
+    show.add_argument('run')
+    restore = sub.add_parser('restore', help='volta os arquivos ao estado anterior à execução')
+    restore.add_argument('run')
+    restore.add_argument('--apply', action='store_true', help='grava (padrão: dry-run)')
+    prune = sub.add_parser('prune', help='apaga execuções antigas e objetos sem uso')
+    prune.add_argument('--keep', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore()
+    try:
+        if args.command == 'list':
+            runs = store.runs()
+            count, total = store.size()
+            print(f'📸 {len(runs)} execução(ões), {count} objetos, {format_size(total)} no store')
+            for m in runs:
+                print(f'   {m["id"]:<50} {len(m["files"]):>4} arquivo(s)  +{format_size(m["stored_bytes"])}')
+        elif args.command == 'show':
+            m = store.load(args.run)
+            print(f'📸 {m["id"]} ({m["created"]})')
+            for rel, digest in m['files'].items():
+                print(f'   {digest[:12] if digest else "(novo)":<12}  {rel}')
+        elif args.command == 'restore':
+            m = store.load(args.run)
+            actions = store.diff(m)
+            print(f'\n📝 Restaurar {m["id"]}: {len(actions)} arquivo(s)')
+            for rel, action in actions:
+                print(f'   {action:<7} {rel}')
+            if not actions:
+                print('✅ Arquivos já estão no estado do snapshot')
+            elif not args.apply:
+                print('\n💡 Dry-run: nada foi gravado. Use --apply para aplicar.')
+            else:
+                undo, _ = store.restore(m['id'])
+                print(f'\n✅ Restaurado. Para desfazer: restore {undo["id"]} --apply')
+        elif args.command == 'prune':
+            removed, freed = store.prune(args.keep)
+            print(f'🗑️  {removed} execução(ões) removidas, {format_size(freed)} liberados')
+    except SnapshotError as e:
+        print(f'❌ {e}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+Codemod: divide arquivos Dart grandes nos limites de classe
+
+Arquivos como comments_section.dart (2.4k linhas) ou quick_forms.dart (2.1k)
+são recompilados e reanalisados inteiros a cada edição, porque a unidade de
+compilação do Dart é a biblioteca. O codemod divide o arquivo em:
+
+    library - bibliotecas separadas. Declarações que se referenciam por nomes
+              privados (_Foo, widget._bar) ficam sempre na mesma biblioteca,
+              então a visibilidade privada é preservada. Os imports do arquivo
+              original são reescritos em todos os dependentes e barrels.
+    part    - arquivos `part` da mesma biblioteca. Preserva toda a
+              privacidade, mas não reduz o que é recompilado (só o tamanho
+              de cada arquivo no editor).
+    auto    - library onde for possível; o que sobrar grande na biblioteca
+              original é dividido em parts.
+
+O relatório mostra o tamanho esperado de invalidação no hot reload antes e
+depois: linhas recompiladas numa edição de corpo (a biblioteca inteira, com
+seus parts) e bibliotecas afetadas numa mudança de API (importadores
+transitivos), ponderados pelo tamanho de cada pedaço.
+
+Uso:
+    python scripts/split_dart_file.py lib/src/features/shared/quick_forms.dart
+    python scripts/split_dart_file.py lib/ui/organisms/sections/comments_section.dart --mode part
+    python scripts/split_dart_file.py lib/services/google_drive_oauth_service.dart --apply
+"""
+
+import argparse
+import posixpath
+import re
+import sys
+
+from codemod import REPO_ROOT, Codemod, detect_newline, with_newline
+from dart_imports import DartProject, relative_uri
+from dart_scanner import IDENT_RE, Decl, code_only, top_level_chunks
+
+# Nomes exportados por bibliotecas dart: comuns, para podar imports sem uso
+DART_LIBRARY_NAMES = {
+    'dart:async': {'Timer', 'Completer', 'StreamController', 'StreamSubscription', 'StreamTransformer',
+                   'Zone', 'FutureOr', 'unawaited', 'TimeoutException', 'runZoned', 'scheduleMicrotask'},
+    'dart:convert': {'json', 'jsonEncode', 'jsonDecode', 'utf8', 'base64', 'base64Encode', 'base64Decode',
+                     'base64Url', 'latin1', 'ascii', 'LineSplitter', 'JsonEncoder', 'JsonDecoder', 'Encoding'},
+    'dart:math': {'max', 'min', 'Random', 'pi', 'sqrt', 'pow', 'sin', 'cos', 'tan', 'atan2', 'log', 'exp',
+                  'Point', 'Rectangle', 'e'},
+    'dart:typed_data': {'Uint8List', 'ByteData', 'Int32List', 'Uint16List', 'Float32List', 'Float64List',
+                        'Int64List', 'Uint32List', 'ByteBuffer', 'Endian'},
+    'dart:io': {'File', 'Directory', 'Platform', 'Process', 'ProcessResult', 'HttpClient', 'HttpServer',
+                'HttpRequest', 'HttpHeaders', 'HttpStatus', 'SocketException', 'FileSystemEntity', 'IOSink',
+                'FileMode', 'exit', 'stdout', 'stderr', 'stdin', 'InternetAddress', 'ContentType', 'gzip',
+                'HttpException', 'WebSocket', 'FileSystemException', 'OSError'},
+    'dart:collection': {'LinkedHashMap', 'LinkedHashSet', 'HashMap', 'HashSet', 'Queue', 'ListQueue',
+                        'SplayTreeMap', 'SplayTreeSet', 'UnmodifiableListView', 'UnmodifiableMapView',
+                        'MapBase', 'ListBase', 'IterableBase', 'LinkedList', 'LinkedListEntry'},
+}
+
+
+# ============================================================================
+# Declarações e agrupamento
+# ============================================================================
+
+class UnionFind:
+    def __init__(self, n):
+        self.parent = list(range(n))
+
+    def find(self, x):
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a, b):
+        self.parent[self.find(a)] = self.find(b)
+
+
+def snake_case(name):
+    name = name.lstrip('_')
+    name = re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', name)
+    name = re.sub(r'(?<=[A-Z])([A-Z][a-z])', r'_\1', name)
+    return name.lower()
+
+
+def private_components(decls):
+    """Agrupa declarações ligadas por nomes privados (precisam da mesma biblioteca)"""
+    uf = UnionFind(len(decls))
+    by_name = {d.name: i for i, d in enumerate(decls) if d.name}
+    owners = {}
+    for j, d in enumerate(decls):
+        for member in d.private_members:
+            owners.setdefault(member, []).append(j)
+    for i, d in enumerate(decls):
+        for token in d.tokens:
+            if token.startswith('_') and token in by_name and by_name[token] != i:
+                uf.union(i, by_name[token])
+        # Membros privados de outra declaração: x._foo, Registry._internal() e
+        # também _foo sem ponto (herdado de uma classe base do mesmo arquivo)
+        undotted = {t for t in d.tokens if t.startswith('_') and t not in by_name} - d.private_members
+        for member in d.dot_private | undotted:
+            for j in owners.get(member, ()):
+                if j != i:
+                    uf.union(i, j)
+    groups = {}
+    for i in range(len(decls)):
+        groups.setdefault(uf.find(i), []).append(i)
+    return list(groups.values())
+
+
+def state_groups(decls, indices):
+    """Para parts: cada widget fica junto do seu State (_FooState + Foo/_Foo)"""
+    uf = UnionFind(len(decls))
+    by_base = {}
+    for i in indices:
+        name = decls[i].name or ''
+        base = name.lstrip('_')
+        if base.endswith('State') and len(base) > len('State'):
+            base = base[:-len('State')]
+        by_base.setdefault(base, []).append(i)
+    for members in by_base.values():
+        for other in members[1:]:
+            uf.union(members[0], other)
+    groups = {}
+    for i in indices:
+        groups.setdefault(uf.find(i), []).append(i)
+    return list(groups.values())
+
+
+def group_title(decls, group):
+    """Nome que batiza o arquivo: a maior declaração com nome (sem o sufixo State)"""
+    named = [i for i in group if decls[i].name]
+    if not named:
+        return None
+    best = max(named, key=lambda i: (not decls[i].is_private, decls[i].lines))
+    name = decls[best].name
+    base = name.lstrip('_')
+    if base.endswith('State') and len(base) > len('State'):
+        trimmed = base[:-len('State')]
+        if any((d.name or '').lstrip('_') == trimmed for d in (decls[i] for i in group)):
+            base = trimmed
+    return base
+
+
+# ============================================================================
+# Planejamento
+# ============================================================================
+
+class SplitPlan:
+    def __init__(self, project, rel, mode, min_lines):
+        # Arquivos CRLF (comments_section.dart, quick_forms.dart) são fatiados já
+        # com \n; main() devolve a quebra original ao gravar
+        text = project.files[rel].text
+        if '\r\n' in text:
+            project = project.with_changes({rel: with_newline(text, '\n')})
+        self.project = project
+        self.rel = rel
+        self.mode = mode
+        self.min_lines = min_lines
+        self.text = project.files[rel].text
+        chunks, tail_start = top_level_chunks(self.text)
+        all_decls = [Decl(self.text[s:e], s, e) for s, e in chunks]
+        self.directive_decls = [d for d in all_decls if d.is_directive]
+        self.decls = [d for d in all_decls if not d.is_directive]
+        self.tail = self.text[tail_start:]
+        self.header_end = max((d.end for d in self.directive_decls), default=0)
+        self.libraries = []  # (novo arquivo, índices)
+        self.parts = []      # (novo arquivo, índices)
+        self.primary = set(range(len(self.decls)))
+
+    def _primary_index(self):
+        stem = posixpath.splitext(posixpath.basename(self.rel))[0]
+        for i, d in enumerate(self.decls):
+            if d.name and snake_case(d.name) == stem:
+                return i
+        return max(range(len(self.decls)), key=lambda i: self.decls[i].lines)
+
+    def _file_name(self, title, taken, part=False):
+        directory = posixpath.dirname(self.rel)
+        stem = posixpath.splitext(posixpath.basename(self.rel))[0]
+        snake = snake_case(title)
+        candidates = [f'{stem}_{snake}.dart'] if part else [f'{snake}.dart', f'{stem}_{snake}.dart']
+        for candidate in candidates:
+            path = posixpath.join(directory, candidate)
+            if path not in self.project.files and path not in taken:
+                return path
+        n = 2
+        while posixpath.join(directory, f'{stem}_{snake}_{n}.dart') in taken:
+            n += 1
+        return posixpath.join(directory, f'{stem}_{snake}_{n}.dart')
+
+    def plan(self):
+        if not self.decls:
+            return
+        primary_index = self._primary_index()
+        taken = set()
+        if self.mode in ('library', 'auto'):
+            components = private_components(self.decls)
+            for group in sorted(components, key=min):
+                if primary_index in group:
+                    continue
+                lines = sum(self.decls[i].lines for i in group)
+                has_public = any(not self.decls[i].is_private for i in group)
+                if lines < self.min_lines or not has_public:
+                    continue
+                path = self._file_name(group_title(self.decls, group), taken)
+                taken.add(path)
+                self.libraries.append((path, sorted(group)))
+                self.primary -= set(group)
+        if self.mode in ('part', 'auto'):
+            for group in sorted(state_groups(self.decls, sorted(self.primary)), key=min):
+                if primary_index in group:
+                    continue
+                if sum(self.decls[i].lines for i in group) < self.min_lines:
+                    continue
+                title = group_title(self.decls, group)
+                if not title:
+                    continue
+                path = self._file_name(title, taken, part=True)
+                taken.add(path)
+                self.parts.append((path, sorted(group)))
+                self.primary -= set(group)
+
+    def public_names(self, indices):
+        return {self.decls[i].name for i in indices if not self.decls[i].is_private}
+
+    def tokens(self, indices):
+        result = set()
+        for i in indices:
+            result |= self.decls[i].tokens
+        return result
+
+    def body(self, indices):
+        return '\n\n'.join(trim_blank_lines(self.decls[i].text) for i in sorted(indices)) + '\n'
+
+
+def trim_blank_lines(text):
+    """Tira linhas em branco (mesmo com espaços) do início e do fim"""
+    return re.sub(r'\A(?:[ \t]*\n)+', '', text).rstrip()
+
+
+def import_needed(project, directive, tokens):
+    """Decide se um import do arquivo original ainda é usado por um pedaço"""
+    if directive.prefix:
+        return directive.prefix in tokens
+    if directive.uri in DART_LIBRARY_NAMES:
+        return bool(DART_LIBRARY_NAMES[directive.uri] & tokens)
+    targets = [t for t in directive.targets if t in project.files]
+    if not targets:
+        return True  # pacote externo: sem como saber os nomes exportados
+    for target in targets:
+        for file, names in project.namespace(target, directive.show, directive.hide).items():
+            if project.files[file].has_extension or names & tokens:
+                return True
+    return False
+
+
+def uri_for(style_uri, from_file, to_file):
+    """URI no mesmo estilo (package: ou relativo) da diretiva original"""
+    if style_uri.startswith('package:'):
+        return f"package:{style_uri[len('package:'):].split('/')[0]}/{to_file[len('lib/'):]}"
+    return relative_uri(from_file, to_file)
+
+
+def directive_line(kind, uri, prefix=None, show=None, hide=None):
+    line = f"{kind} '{uri}'"
+    if prefix:
+        line += f' as {prefix}'
+    if show:
+        line += ' show ' + ', '.join(sorted(show))
+    if hide:
+        line += ' hide ' + ', '.join(sorted(hide))
+    return line + ';\n'
+
+
+def names_used(dart_text, directive):
+    """Nomes usados por um dependente através de uma diretiva (com ou sem prefixo)"""
+    code = code_only(dart_text)
+    if directive.prefix:
+        return set(re.findall(rf'\b{re.escape(directive.prefix)}\s*\.\s*([A-Za-z_$][\w$]*)', code))
+    body = re.sub(r"^\s*(?:import|export|part)\b[^;]*;", '', code, flags=re.MULTILINE)
+    return set(IDENT_RE.findall(body))
+
+
+def build_changes(plan):
+    """Conteúdo novo do arquivo original, dos pedaços e dos dependentes"""
+    project = plan.project
+    rel = plan.rel
+    changes = {}
+    file_directives = project.files[rel].directives
+    units = [(rel, sorted(plan.primary))] + plan.libraries
+    part_indices = set(i for _, group in plan.parts for i in group)
+    unit_names = {path: plan.public_names(group) for path, group in units}
+    unit_names[rel] = plan.public_names(plan.primary | part_indices)
+
+    def header_for(path, indices, keep_others):
+        """
+        Diretivas do arquivo original como estavam (comentários e linhas em
+        branco entre os grupos de import), sem os imports que o pedaço não usa.
+        Os imports dos outros pedaços entram depois do último import mantido
+        """
+        tokens = plan.tokens(indices)
+        kept = {
+            i for i, d in enumerate(file_directives)
+            if (import_needed(project, d, tokens) if d.kind == 'import' else keep_others)
+        }
+        siblings = ''.join(
+            directive_line('import', relative_uri(path, other))
+            for other, names in unit_names.items() if other != path and names & tokens
+        )
+        last_import = max((i for i in kept if file_directives[i].kind == 'import'), default=None)
+        pieces = [] if last_import is not None else [siblings]
+        last = file_directives[0].start if file_directives else 0
+        for i, d in enumerate(file_directives):
+            pieces.append(plan.text[last:d.start])
+            if i in kept:
+                pieces.append(plan.text[d.start:d.end].rstrip('\n') + '\n')
+            if i == last_import:
+                pieces.append(siblings)
+            last = d.end
+        # grupos de import que ficaram vazios deixam linhas em branco seguidas
+        text = re.sub(r'\n(?:[ \t]*\n){2,}', '\n\n', ''.join(pieces))
+        text = trim_blank_lines(text)
+        return text + '\n' if text else ''
+
+    # Arquivo original: diretivas não-import preservadas, imports podados, parts no fim
+    primary_indices = plan.primary | part_indices
+    lead = plan.text[:file_directives[0].start] if file_directives else ''
+    sections = []
+    header = trim_blank_lines(lead + header_for(rel, primary_indices, keep_others=True))
+    if header:
+        sections.append(header + '\n')
+    if plan.parts:
+        sections.append(''.join(directive_line('part', posixpath.basename(p)) for p, _ in plan.parts))
+    sections.append(plan.body(plan.primary))
+    changes[rel] = '\n'.join(sections)
+
+    for path, group in plan.parts:
+        changes[path] = f"part of '{posixpath.basename(rel)}';\n\n" + plan.body(group)
+    for path, group in plan.libraries:
+        header = header_for(path, group, keep_others=False)
+        changes[path] = (header + '\n' if header else '') + plan.body(group)
+
+    # Dependentes: importam os pedaços que usam; exports de barrels ganham os novos arquivos
+    moved = [(path, unit_names[path]) for path, _ in plan.libraries]
+    if not moved:
+        return changes
+    remaining = unit_names[rel] | set().union(*(
+        names for file, names in project.namespace(rel).items() if file != rel
+    )) if project.namespace(rel) else unit_names[rel]
+    edits = {}
+    for dep_rel, directive in project.dependents(rel):
+        if dep_rel == rel:
+            continue
+        text = project.files[dep_rel].text
+        new_lines = []
+        keep_original = True
+        if directive.kind == 'export':
+            for path, names in moved:
+                show = names & directive.show if directive.show is not None else None
+                if directive.show is not None and not show:
+                    continue
+                new_lines.append(directive_line('export', uri_for(directive.uri, dep_rel, path),
+                                                show=show, hide=directive.hide & names or None))
+            if directive.show is not None and not (directive.show & remaining):
+                keep_original = False
+        else:
+            used = names_used(text, directive)
+            if directive.show is not None:
+                used &= directive.show
+            for path, names in moved:
+                if names & used:
+                    show = names & directive.show if directive.show is not None else None
+                    new_lines.append(directive_line('import', uri_for(directive.uri, dep_rel, path),
+                                                    prefix=directive.prefix, show=show))
+            primary_used = used & remaining
+            keep_original = bool(primary_used) or any(
+                project.files[f].has_extension for f in project.namespace(rel)
+            )
+        if not new_lines:
+            continue
+        original = text[directive.start:directive.end]
+        replacement = (original if keep_original else '') + ''.join(new_lines)
+        edits.setdefault(dep_rel, []).append((directive.start, directive.end, replacement))
+
+    # Um dependente pode ter várias diretivas para o arquivo (ex.: import e export):
+    # aplica todas, de trás para frente, sobre o texto original
+    for dep_rel, spans in edits.items():
+        text = project.files[dep_rel].text
+        for start, end, replacement in sorted(spans, reverse=True):
+            text = text[:start] + replacement + text[end:]
+        changes[dep_rel] = text
+    return changes
+
+
+# ============================================================================
+# Relatório de invalidação
+# ============================================================================
+
+def invalidation(project, files):
+    """
+    Para cada arquivo: (linhas do arquivo, linhas recompiladas numa edição de
+    corpo, bibliotecas afetadas numa mudança de API)
+    """
+    rows = []
+    for rel in files:
+        library = project.library_of(rel)
+        rows.append((rel, project.files[rel].lines, project.library_lines(library),
+                     len(project.importers_closure(library))))
+    return rows
+
+
+def weighted(rows, column):
+    total = sum(r[1] for r in rows) or 1
+    return sum(r[1] * r[column] for r in rows) / total
+
+
+def print_invalidation(before, after):
+    print('\n🔥 Invalidação esperada no hot reload (ponderada pelo tamanho de cada pedaço)')
+    print(f'   {"arquivo":<70} {"linhas":>7} {"recompila":>10} {"importadores":>13}')
+    for label, rows in (('antes', before), ('depois', after)):
+        print(f'   [{label}]')
+        for rel, lines, recompiled, importers in rows:
+            print(f'   {rel:<70} {lines:>7} {recompiled:>10} {importers:>13}')
+    b_body, a_body = weighted(before, 2), weighted(after, 2)
+    b_api, a_api = weighted(before, 3), weighted(after, 3)
+    print(f'\n   Edição de corpo: {b_body:.0f} -> {a_body:.0f} linhas recompiladas'
+          f' ({(a_body - b_body) / b_body * 100 if b_body else 0:+.0f}%)')
+    print(f'   Mudança de API:  {b_api:.1f} -> {a_api:.1f} bibliotecas invalidadas')
+    if a_body >= b_body:
+        print('   ℹ️  Parts compilam junto com a biblioteca: só reduzem o tamanho dos arquivos.')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Divide arquivos Dart grandes nos limites de classe')
+    parser.add_argument('files', nargs='+', help='arquivos .dart (relativos à raiz)')
+    parser.add_argument('--mode', choices=('auto', 'library', 'part'), default='auto')
+    parser.add_argument('--min-lines', type=int, default=150, help='tamanho mínimo de cada pedaço')
+    parser.add_argument('--apply', action='store_true', help='grava as mudanças (padrão: dry-run)')
+    args = parser.parse_args(argv)
+
+    project = DartProject(REPO_ROOT, ('lib', 'test'))
+    run = Codemod('split-dart-file', apply=args.apply)
+    for target in args.files:
+        rel = posixpath.normpath(target.replace('\\', '/'))
+        current = project.with_changes(run.changes)
+        if rel not in current.files:
+            print(f'❌ Arquivo não encontrado: {rel}')
+            return 1
+        plan = SplitPlan(current, rel, args.mode, args.min_lines)
+        plan.plan()
+        print(f'\n✂️  {rel}: {current.files[rel].lines} linhas, {len(plan.decls)} declarações de topo')
+        if not plan.libraries and not plan.parts:
+            print(f'   Nada a dividir: nenhum grupo independente com {args.min_lines}+ linhas'
+                  ' (classes ligadas por nomes privados ficam juntas)'
+                  + ('; tente --mode part' if args.mode == 'library' else ''))
+            continue
+        for path, group in plan.libraries:
+            print(f'   📚 biblioteca {path}: {", ".join(plan.decls[i].name or "?" for i in group)}')
+        for path, group in plan.parts:
+            print(f'   🧩 part {path}: {", ".join(plan.decls[i].name or "?" for i in group)}')
+
+        changes = build_changes(plan)
+        after_project = current.with_changes(changes)
+        pieces = [rel] + [p for p, _ in plan.libraries] + [p for p, _ in plan.parts]
+        print_invalidation(invalidation(current, [rel]), invalidation(after_project, pieces))
+        for path, content in changes.items():
+            source = current.files[path].text if path in current.files else current.files[rel].text
+            run.write(path, with_newline(content, detect_newline(source)))
+    if run.changes:
+        print('\n💡 Imports de pacotes externos são copiados para cada pedaço; '
+              'rode flutter analyze para remover os que ficarem sem uso.')
+    run.commit()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Testes do pipeline de codemods (rodar da raiz: python -m pytest scripts/tests)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from codemod import Codemod, CodemodError  # noqa: E402
+
+
+def make_file(tmp_path, rel, data):
+    path = tmp_path / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_mixed_file_matches_utf8_and_legacy_forms(tmp_path):
+    # UTF-8 com um "é" solto em cp1252: o arquivo é detectado como cp1252
+    make_file(tmp_path, 'lib/a.dart', "// ação\n".encode('utf-8') + b"// caf\xe9\n" + "// ação\n".encode('cp1252'))
+    run = Codemod('teste', root=tmp_path)
+    assert run.encoding('lib/a.dart') == 'cp1252'
+
+    assert run.replace('lib/a.dart', 'ação', 'operação') == 2
+    # cada ocorrência recebe a substituição na forma em que estava
+    assert run.changes['lib/a.dart'] == (
+        "// operação\n".encode('utf-8') + b"// caf\xe9\n" + "// operação\n".encode('cp1252'))
+
+
+def test_needle_not_representable_in_legacy_encoding(tmp_path):
+    make_file(tmp_path, 'lib/a.dart', b"// caf\xe9\n")
+    run = Codemod('teste', root=tmp_path)
+    assert run.replace('lib/a.dart', '🟢', 'ok') == 0
+
+    make_file(tmp_path, 'lib/b.dart', "// 🟢 caf".encode('utf-8') + b"\xe9\n")
+    assert run.replace('lib/b.dart', '🟢', 'ok') == 1
+    assert run.changes['lib/b.dart'] == b"// ok caf\xe9\n"
+
+
+def test_replacement_not_representable_names_the_file(tmp_path):
+    make_file(tmp_path, 'lib/a.dart', b"// caf\xe9\n")
+    run = Codemod('teste', root=tmp_path)
+    with pytest.raises(CodemodError, match='lib/a.dart'):
+        run.replace('lib/a.dart', 'café', '🟢')
+
+
+def test_summary_counts_bytes_only_for_binary_file_types(tmp_path):
+    make_file(tmp_path, 'lib/a.dart', b"// bloco \x00E9 caf\xe9\nvoid main() {}\n")
+    make_file(tmp_path, 'assets/logo.png', b'\x89PNG\r\n\x1a\n' + b'\0' * 30)
+    run = Codemod('teste', root=tmp_path)
+    run.replace('lib/a.dart', 'main', 'run')
+    run.write('assets/logo.png', b'\x89PNG\r\n\x1a\n' + b'\0' * 10)
+    assert run.summary() == [
+        ('assets/logo.png', 'altera', 18, 38),
+        ('lib/a.dart', 'altera', 1, 1),
+    ]
+
+
+def test_ascii_needle_in_mixed_file_gets_utf8_replacement(tmp_path):
+    make_file(tmp_path, 'lib/m.dart', "// ação foo\n".encode('utf-8') + b"// caf\xe9\n")
+    run = Codemod('teste', root=tmp_path)
+    assert run.replace('lib/m.dart', 'foo', 'não') == 1
+    assert run.changes['lib/m.dart'] == "// ação não\n".encode('utf-8') + b"// caf\xe9\n"
+
+    # arquivo cp1252 de verdade continua recebendo cp1252
+    make_file(tmp_path, 'lib/legacy.dart', b"// caf\xe9 foo\n")
+    assert run.replace('lib/legacy.dart', 'foo', 'não') == 1
+    assert run.changes['lib/legacy.dart'] == b"// caf\xe9 n\xe3o\n"
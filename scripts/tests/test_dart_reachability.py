@@ -0,0 +1,84 @@
+"""
+Testes da análise de reachability (rodar da raiz: python -m pytest scripts/tests)
+
+Os projetos Dart são montados em diretórios temporários: nada aqui depende de
+lib/ do app.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dart_imports import DartProject  # noqa: E402
+from dart_reachability import analyze  # noqa: E402
+
+UNUSED_CARD = """import 'package:flutter/material.dart';
+
+/// Card que ninguém usa, só reexportado pelo barrel
+class UnusedCard extends StatelessWidget {
+  final String title;
+  const UnusedCard({super.key, required this.title});
+
+  @override
+  Widget build(BuildContext context) {
+    final label = title.isEmpty ? 'vazio' : title;
+    if (label.length > 3) {
+      return Container(child: Row(children: [Text(label)]));
+    }
+    return const SizedBox();
+  }
+}
+"""
+
+USED_CARD = """import 'package:flutter/material.dart';
+
+class UsedCard extends StatelessWidget {
+  const UsedCard({super.key});
+
+  @override
+  Widget build(BuildContext context) => const Text('ok');
+}
+
+String formatTitle(String value) => value.trim();
+"""
+
+MAIN = """import 'package:flutter/material.dart';
+import 'widgets/widgets.dart';
+
+void main() {
+  final title = formatTitle(' app ');
+  if (title.isNotEmpty) {
+    runApp(const UsedCard());
+  }
+}
+"""
+
+
+def make_project(tmp_path, files):
+    for rel, text in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+    return DartProject(tmp_path)
+
+
+def test_declared_names_ignore_members_and_locals(tmp_path):
+    project = make_project(tmp_path, {'lib/unused_card.dart': UNUSED_CARD})
+    assert project.files['lib/unused_card.dart'].names == {'UnusedCard'}
+
+
+def test_barrel_export_without_users_is_reported(tmp_path):
+    project = make_project(tmp_path, {
+        'lib/main.dart': MAIN,
+        'lib/widgets/widgets.dart': "export 'used_card.dart';\nexport 'unused_card.dart';\n",
+        'lib/widgets/used_card.dart': USED_CARD,
+        'lib/widgets/unused_card.dart': UNUSED_CARD,
+        'lib/orphan.dart': "class Orphan {}\n",
+    })
+    unreachable, export_only, dead_exports = analyze(project, ['lib/main.dart'])
+    assert unreachable == ['lib/orphan.dart']
+    assert export_only == ['lib/widgets/unused_card.dart']
+    assert [(barrel, uri) for barrel, uri, _ in dead_exports] == [
+        ('lib/widgets/widgets.dart', 'unused_card.dart'),
+    ]
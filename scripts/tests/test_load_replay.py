@@ -0,0 +1,92 @@
+"""
+Testes da extração de queries e do split de SQL do load_replay (rodar da raiz:
+python -m pytest scripts/tests)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from load_replay import extract_file, split_sql  # noqa: E402
+
+TASKS_REPOSITORY = """
+  Future<List<Map<String, dynamic>>> getTasks({String? projectId, String? status, int offset = 0}) async {
+    var queryBuilder = _client
+        .from('tasks')
+        .select('id, title, status, project_id, projects:project_id(name)');
+
+    if (projectId != null) {
+      queryBuilder = queryBuilder.eq('project_id', projectId);
+    }
+    if (status != null) {
+      queryBuilder = queryBuilder.eq('status', status);
+    }
+    if (search != null) {
+      queryBuilder = queryBuilder.or('title.ilike.%$search%,description.ilike.%$search%');
+    }
+
+    final ordered = queryBuilder.order('created_at', ascending: false);
+    final response = await ordered.range(offset, offset + 49);
+    return List<Map<String, dynamic>>.from(response);
+  }
+
+  Future<List<Map<String, dynamic>>> getClients() async {
+    return await _client.from('clients').select('id, name').order('name', ascending: true).limit(20);
+  }
+
+  Future<Map<String, dynamic>?> getProject(String id) async {
+    return await _client.from('projects').select().eq('id', id).maybeSingle();
+  }
+"""
+
+
+def test_continuation_chain_collects_every_step():
+    tasks, clients, project = extract_file('lib/tasks_repository.dart', TASKS_REPOSITORY)
+
+    assert tasks['table'] == 'tasks'
+    # relação embutida (projects:project_id(name)) não é coluna da tabela
+    assert tasks['columns'] == ['id', 'title', 'status', 'project_id']
+    assert tasks['filters'] == [
+        {'column': 'project_id', 'op': 'eq'},
+        {'column': 'status', 'op': 'eq'},
+    ]
+    assert tasks['or_filters'] == [[
+        {'column': 'title', 'op': 'ilike'},
+        {'column': 'description', 'op': 'ilike'},
+    ]]
+    assert tasks['order'] == [{'column': 'created_at', 'ascending': False}]
+    # range(offset, offset + 49) não é literal: usa o tamanho de página padrão
+    assert tasks['page_size'] == 50
+
+    assert clients['page_size'] == 20
+    assert clients['order'] == [{'column': 'name', 'ascending': True}]
+    assert project['single'] and project['filters'] == [{'column': 'id', 'op': 'eq'}]
+
+
+def test_literal_range_gives_page_size():
+    text = "final rows = await _client.from('comments').select('id').range(0, 24);"
+    (shape,) = extract_file('lib/comments.dart', text, default_page_size=10)
+    assert shape['page_size'] == 25
+
+
+def test_split_sql_keeps_dollar_bodies_and_escaped_quotes():
+    sql = """
+-- comentário; com ponto e vírgula
+CREATE FUNCTION touch() RETURNS trigger AS $$
+BEGIN
+  NEW.updated_at := now();
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+INSERT INTO notes (body) VALUES ('it''s; fine');
+DO $body$ BEGIN PERFORM 1; END $body$;
+/* bloco; */ SELECT 1
+"""
+    statements = split_sql(sql)
+    assert len(statements) == 4
+    assert statements[0].endswith('$$ LANGUAGE plpgsql')
+    assert 'RETURN NEW;' in statements[0]
+    assert statements[1] == "INSERT INTO notes (body) VALUES ('it''s; fine')"
+    assert statements[2] == 'DO $body$ BEGIN PERFORM 1; END $body$'
+    assert statements[3].endswith('SELECT 1')
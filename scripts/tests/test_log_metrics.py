@@ -0,0 +1,68 @@
+"""
+Testes do analisador de logs (rodar da raiz: python -m pytest scripts/tests)
+
+As linhas usam os marcadores reais do app (debugPrint do _GBBlockWidget,
+UploadManager e TaskTimerService).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from log_metrics import DEFAULT_RULES, Analyzer  # noqa: E402
+
+
+def analyze(lines):
+    analyzer = Analyzer(DEFAULT_RULES, interval=3600, window_slots=6, max_keys=100,
+                        max_pending=100, timeout=3600, top=10)
+    for line in lines:
+        analyzer.feed(line + '\n', 0.0)
+    return {m.name: m for m in analyzer.metrics}
+
+
+def test_debounce_pairs_last_keystroke_with_commit_marker():
+    metrics = analyze([
+        '10:00:00.000 flutter: 🟢🟢🟢 [_GBBlockWidget._onTextChanged] text.length=4',
+        '10:00:00.200 flutter: 🟢🟢🟢 [_GBBlockWidget._onTextChanged] text.length=5',
+        '10:00:00.700 flutter: 🟢🟢🟢 [_GBBlockWidget._onTextChanged] CHAMANDO widget.onChanged após debounce',
+    ])
+    debounce = metrics['debounce_commit']
+    assert debounce.session.total == 1
+    assert not debounce.pending
+    # medido da última tecla (500 ms), não da primeira (700 ms)
+    assert 400 < debounce.session.percentile(50) <= 625
+
+
+def test_rebuilds_are_counted_per_widget_index():
+    metrics = analyze([
+        'I/flutter ( 4242): [GB] didUpdateWidget(index=3): sync controller (len 4 -> 5)',
+        'I/flutter ( 4242): [GB] didUpdateWidget(index=3): sync controller (len 5 -> 6)',
+        'I/flutter ( 4242): [GB] didUpdateWidget(index=7): sync controller (len 0 -> 1)',
+    ])
+    assert metrics['rebuild'].session.counts == {'GB#3': 2, 'GB#7': 1}
+
+
+def test_upload_and_timer_markers_are_paired_by_key():
+    metrics = analyze([
+        '09:00:00 flutter: [UploadManager] start fileId=a1',
+        '09:00:01 flutter: [UploadManager] start fileId=b2',
+        '09:00:03 flutter: [UploadManager] fail fileId=b2 erro=SocketException',
+        '09:00:04 flutter: [UploadManager] done fileId=a1',
+        '09:00:05 flutter: [TaskTimerService] start taskId=t9',
+        '09:30:05 flutter: [TaskTimerService] stop taskId=t9',
+    ])
+    assert metrics['upload'].session.total == 2
+    assert metrics['upload'].unmatched == 0
+    assert metrics['timer'].session.total == 1
+    assert metrics['timer'].session.percentile(50) >= 30 * 60 * 1000
+
+
+def test_upload_across_midnight_is_not_negative():
+    metrics = analyze([
+        '23:59:59.000 [UploadManager] start fileId=x',
+        '00:00:02.000 [UploadManager] done fileId=x',
+    ])
+    upload = metrics['upload']
+    assert upload.session.total == 1
+    assert 2000 < upload.session.percentile(50) <= 3800
@@ -0,0 +1,46 @@
+"""
+Testes do otimizador de PNG/ICO (rodar da raiz: python -m pytest scripts/tests)
+"""
+
+import struct
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import optimize_assets  # noqa: E402
+from optimize_assets import decode, dib_to_png, to_rgba  # noqa: E402
+
+
+def ico_dib(width, height, bgra_rows, mask_rows):
+    """DIB 32 bits de .ico: cabeçalho, pixels de baixo para cima e máscara AND"""
+    header = struct.pack('<IiiHHIIiiII', 40, width, height * 2, 1, 32, 0, 0, 0, 0, 0, 0)
+    return header + b''.join(reversed(bgra_rows)) + b''.join(reversed(mask_rows))
+
+
+def test_dib_with_and_mask_becomes_equivalent_png():
+    width, height = 4, 2
+    bgra = [bytes([10, 20, 30, 0]) * width, bytes([40, 50, 60, 0]) * width]
+    # alfa todo zero: a transparência vem da máscara (bit 1 = transparente)
+    mask = [bytes([0b10100000, 0, 0, 0]), bytes([0, 0, 0, 0])]
+    png = dib_to_png(ico_dib(width, height, bgra, mask))
+    assert png is not None
+
+    ihdr, _, _, rows = decode(png)
+    assert to_rgba(ihdr['ctype'], rows) == [
+        bytes([30, 20, 10, 0, 30, 20, 10, 255, 30, 20, 10, 0, 30, 20, 10, 255]),
+        bytes([60, 50, 40, 255]) * width,
+    ]
+
+
+def test_dib_rejected_when_png_does_not_match(monkeypatch):
+    monkeypatch.setattr(optimize_assets, 'same_pixels', lambda *args: False)
+    bgra = [bytes([1, 2, 3, 255]) * 2] * 2
+    assert dib_to_png(ico_dib(2, 2, bgra, [bytes(4)] * 2)) is None
+
+
+def test_file_outside_repo_is_an_error(tmp_path, capsys):
+    outside = tmp_path / 'x.png'
+    outside.write_bytes(b'')
+    assert optimize_assets.main([str(outside)]) == 1
+    assert 'Fora do projeto' in capsys.readouterr().out
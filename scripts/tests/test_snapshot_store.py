@@ -0,0 +1,30 @@
+"""
+Testes do store de snapshots (rodar da raiz: python -m pytest scripts/tests)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from snapshot_store import SnapshotStore  # noqa: E402
+
+
+def test_last_is_the_restore_taken_in_the_same_second(tmp_path):
+    target = tmp_path / 'lib' / 'a.dart'
+    target.parent.mkdir()
+    target.write_text('v1', encoding='utf-8')
+    store = SnapshotStore(tmp_path)
+
+    run = store.snapshot('zz-run', ['lib/a.dart'])
+    target.write_text('v2', encoding='utf-8')
+    undo, actions = store.restore(run['id'])
+
+    assert actions == [('lib/a.dart', 'altera')]
+    assert target.read_text(encoding='utf-8') == 'v1'
+    assert store.load('last')['id'] == undo['id']
+
+    # "restore last" desfaz a restauração
+    store.restore('last')
+    assert target.read_text(encoding='utf-8') == 'v2'
+
@@ -0,0 +1,92 @@
+"""
+Testes do split de arquivos Dart (rodar da raiz: python -m pytest scripts/tests)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dart_imports import DartProject  # noqa: E402
+from split_dart_file import SplitPlan, build_changes  # noqa: E402
+
+
+def dart_class(name, members=40):
+    return f'class {name} {{\n' + ''.join(f'  int f{i}() => {i};\n' for i in range(members)) + '}\n\n'
+
+
+def make_project(tmp_path, files, newline='\n'):
+    for rel, text in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(text.replace('\n', newline).encode('utf-8'))
+    return DartProject(tmp_path)
+
+
+def plan_for(project, rel, mode='library', min_lines=20):
+    plan = SplitPlan(project, rel, mode, min_lines)
+    plan.plan()
+    return plan
+
+
+def test_dependent_with_import_and_export_gets_both_rewritten(tmp_path):
+    files = {
+        'lib/forms/forms.dart': dart_class('Forms') + dart_class('AlphaDialog') + dart_class('BetaDialog'),
+        'lib/app.dart': "import 'forms/forms.dart';\nexport 'forms/forms.dart';\n\n"
+                        "void run() { AlphaDialog(); Forms(); }\n",
+    }
+    project = make_project(tmp_path, files)
+    plan = plan_for(project, 'lib/forms/forms.dart')
+    assert [path for path, _ in plan.libraries] == ['lib/forms/alpha_dialog.dart', 'lib/forms/beta_dialog.dart']
+
+    app = build_changes(plan)['lib/app.dart']
+    assert app.startswith(
+        "import 'forms/forms.dart';\n"
+        "import 'forms/alpha_dialog.dart';\n"
+        "export 'forms/forms.dart';\n"
+        "export 'forms/alpha_dialog.dart';\n"
+        "export 'forms/beta_dialog.dart';\n"
+    )
+
+
+def test_undotted_inherited_private_member_keeps_classes_together(tmp_path):
+    text = ('class BasePage {\n  void _track() {}\n}\n\n'
+            'class HomePage extends BasePage {\n  void open() {\n    _track();\n  }\n}\n'
+            + dart_class('OtherPage'))
+    plan = plan_for(make_project(tmp_path, {'lib/base_page.dart': text}), 'lib/base_page.dart', min_lines=5)
+    assert [path for path, _ in plan.libraries] == ['lib/other_page.dart']
+
+
+def test_private_named_constructor_is_a_member(tmp_path):
+    text = ('class Registry {\n  Registry._internal();\n'
+            '  static final instance = Registry._internal();\n}\n\n'
+            'class Consumer {\n  // usa o construtor privado\n'
+            '  final registry = Registry._internal();\n}\n'
+            + dart_class('Unrelated'))
+    plan = plan_for(make_project(tmp_path, {'lib/registry.dart': text}), 'lib/registry.dart', min_lines=3)
+    assert [path for path, _ in plan.libraries] == ['lib/unrelated.dart']
+
+
+def test_crlf_file_keeps_import_groups_without_extra_blank_lines(tmp_path):
+    header = ("// Formulários rápidos\n"
+              "import 'dart:async';\n\n"
+              "import 'package:flutter/material.dart';\n"
+              "import 'package:uuid/uuid.dart';\n\n"
+              "import 'utils.dart';\n\n")
+    forms = dart_class('Forms').replace('{\n', '{\n  Timer? timer;\n  Helper? helper;\n', 1)
+    files = {
+        'lib/forms.dart': header + forms + '\n' + dart_class('AlphaDialog'),
+        'lib/utils.dart': 'class Helper {}\n',
+    }
+    project = make_project(tmp_path, files, newline='\r\n')
+    plan = plan_for(project, 'lib/forms.dart')
+    assert [path for path, _ in plan.libraries] == ['lib/alpha_dialog.dart']
+
+    changes = build_changes(plan)
+    new_forms, alpha = changes['lib/forms.dart'], changes['lib/alpha_dialog.dart']
+    assert '\r' not in new_forms + alpha  # main() devolve o CRLF ao gravar
+    assert '\n\n\n' not in new_forms and '\n\n\n' not in alpha
+    assert new_forms.startswith(header + 'class Forms {')
+    # dart:async e utils.dart sem uso no pedaço; o grupo do meio fica como estava
+    assert alpha.startswith("import 'package:flutter/material.dart';\n"
+                            "import 'package:uuid/uuid.dart';\n\nclass AlphaDialog {")